@@ -71,7 +71,7 @@ else:  # Sector mode
         tickers = get_all_tickers()
     else:
         df_filtered = dashboard_data.metadata.filter(pl.col("sector") == selected_sector)
-        tickers = df_filtered.select("ticker").to_series().to_list()
+        tickers = df_filtered.get_column("ticker").to_list()
 
 if not tickers:
     render_empty_state("No tickers found in dataset")
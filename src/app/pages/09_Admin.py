@@ -170,9 +170,10 @@ with meta_col1:
             changes = 0
             current_map = {p.ticker: p.shares for p in positions}
 
-            for _, row in edited_df.iterrows():
-                ticker = row["ticker"]
-                new_shares = row["shares"]
+            # Plain tuples instead of a pd.Series per row
+            for ticker, new_shares in edited_df[["ticker", "shares"]].itertuples(
+                index=False, name=None
+            ):
                 old_shares = current_map.get(ticker)
 
                 if old_shares is not None and new_shares != old_shares:
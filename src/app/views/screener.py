@@ -161,7 +161,7 @@ def key_to_selected_tickers(
     )
 
     if not selected_tickers and return_all_if_none:
-        selected_tickers = filtered_metadata.select(pl.col("ticker")).to_series().to_list()
+        selected_tickers = filtered_metadata.get_column("ticker").to_list()
     return selected_tickers
 
 
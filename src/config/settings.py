@@ -31,6 +31,9 @@ class AppSettings(BaseModel):
     base_dir: Path = Field(default=Path("data/prod"))
     archive_dir: Path = Field(default=Path("data/archive"))
     initial_price_start_date: str = Field(default="2021-01-01")
+    # zstd level of the snapshot archives; low levels write much faster for a
+    # slightly larger file
+    snapshot_compression_level: int = Field(default=3, ge=1, le=22)
 
     etf_config_dir: Path = Field(default=Path("config/etfs"))
 
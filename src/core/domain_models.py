@@ -4,7 +4,7 @@ from typing import Any
 
 import polars as pl
 from loguru import logger
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 # --- Constants & Schemas ---
 
@@ -23,6 +23,19 @@ STOCK_PRICE_SCHEMA = {
     "dividend": pl.Float64,
 }
 
+# Schemas of the columnar ETF allocation views built once per ETFComposition
+ETF_ALLOCATION_SCHEMA = {
+    "ticker": pl.Utf8,
+    "category": pl.Utf8,
+    "weight": pl.Float64,
+}
+ETF_HOLDING_SCHEMA = {
+    "etf_ticker": pl.Utf8,
+    "holding_ticker": pl.Utf8,
+    "holding_name": pl.Utf8,
+    "weight": pl.Float64,
+}
+
 
 # --- Enums ---
 
@@ -73,7 +86,7 @@ class StockPrice(BaseModel):
     This model is primarily for single-record API responses or strict validation.
     """
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     ticker: str
     date: date
@@ -189,6 +202,19 @@ class FinancialReport(BaseModel):
         return self.total_equity - intangibles
 
 
+# Polars schema of stored fundamentals, in FinancialReport field order; every
+# financial field is an optional float, so only the metadata needs spelling out
+_REPORT_METADATA_SCHEMA = {
+    "ticker": pl.Utf8,
+    "report_date": pl.Date,
+    "period_type": pl.Utf8,
+    "currency": pl.Utf8,
+}
+FINANCIAL_REPORT_SCHEMA = {
+    name: _REPORT_METADATA_SCHEMA.get(name, pl.Float64) for name in FinancialReport.model_fields
+}
+
+
 class AssetMetadata(BaseModel):
     """Metadata about a financial asset."""
 
@@ -226,11 +252,11 @@ class AssetMetadata(BaseModel):
 
     last_updated: date | None = None
 
-    def to_dict(self) -> dict[str, str | None]:
+    def to_dict(self) -> dict[str, Any]:
         """Convert AssetMetadata to a dictionary for easy serialization."""
-        # just use the model dump
-        data = self.model_dump()
-        return data
+        # All fields are flat, so the raw field values equal model_dump()
+        # without its recursive conversion overhead
+        return dict(self.__dict__)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "AssetMetadata":
@@ -286,6 +312,41 @@ class ETFComposition(BaseModel):
         default_factory=list, description="List of top holdings in the ETF"
     )
 
+    # Columnar views of the lists above, built once after validation
+    _sectors: pl.DataFrame = PrivateAttr()
+    _countries: pl.DataFrame = PrivateAttr()
+    _holdings: pl.DataFrame = PrivateAttr()
+
+    @model_validator(mode="after")
+    def build_frames(self) -> "ETFComposition":
+        """Materialize allocations as DataFrames so accessors and sums stay in Polars."""
+        self._sectors = pl.DataFrame(
+            {
+                "ticker": [self.ticker] * len(self.sector_weights),
+                "category": [item.category for item in self.sector_weights],
+                "weight": [item.weight for item in self.sector_weights],
+            },
+            schema=ETF_ALLOCATION_SCHEMA,
+        )
+        self._countries = pl.DataFrame(
+            {
+                "ticker": [self.ticker] * len(self.country_weights),
+                "category": [item.category for item in self.country_weights],
+                "weight": [item.weight for item in self.country_weights],
+            },
+            schema=ETF_ALLOCATION_SCHEMA,
+        )
+        self._holdings = pl.DataFrame(
+            {
+                "etf_ticker": [self.ticker] * len(self.top_holdings),
+                "holding_ticker": [holding.ticker for holding in self.top_holdings],
+                "holding_name": [holding.name for holding in self.top_holdings],
+                "weight": [holding.weight for holding in self.top_holdings],
+            },
+            schema=ETF_HOLDING_SCHEMA,
+        )
+        return self
+
     @model_validator(mode="after")
     def validate_coverage(self) -> "ETFComposition":
         """
@@ -334,82 +395,29 @@ class ETFComposition(BaseModel):
     @property
     def total_sector_coverage(self) -> float:
         """Calculate total sector coverage percentage."""
-        return sum(item.weight for item in self.sector_weights)
+        return float(self._sectors["weight"].sum())
 
     @property
     def total_country_coverage(self) -> float:
         """Calculate total country coverage percentage."""
-        return sum(item.weight for item in self.country_weights)
+        return float(self._countries["weight"].sum())
 
     @property
     def total_top_holdings_coverage(self) -> float:
         """Calculate total coverage percentage of top holdings."""
-        return sum(holding.weight for holding in self.top_holdings)
+        return float(self._holdings["weight"].sum())
 
     @property
     def sectors_df(self) -> pl.DataFrame:
         """Return sector allocations as a Polars DataFrame."""
-        if not self.sector_weights:
-            return pl.DataFrame(
-                schema={
-                    "ticker": pl.Utf8,
-                    "category": pl.Utf8,
-                    "weight": pl.Float64,
-                }
-            )
-        return pl.DataFrame(
-            [
-                {
-                    "ticker": self.ticker,
-                    "category": item.category,
-                    "weight": item.weight,
-                }
-                for item in self.sector_weights
-            ]
-        )
+        return self._sectors
 
     @property
     def countries_df(self) -> pl.DataFrame:
         """Return country allocations as a Polars DataFrame."""
-        if not self.country_weights:
-            return pl.DataFrame(
-                schema={
-                    "ticker": pl.Utf8,
-                    "category": pl.Utf8,
-                    "weight": pl.Float64,
-                }
-            )
-        return pl.DataFrame(
-            [
-                {
-                    "ticker": self.ticker,
-                    "category": item.category,
-                    "weight": item.weight,
-                }
-                for item in self.country_weights
-            ]
-        )
+        return self._countries
 
     @property
     def top_holdings_df(self) -> pl.DataFrame:
         """Return top holdings as a Polars DataFrame."""
-        if not self.top_holdings:
-            return pl.DataFrame(
-                schema={
-                    "etf_ticker": pl.Utf8,
-                    "holding_ticker": pl.Utf8,
-                    "holding_name": pl.Utf8,
-                    "weight": pl.Float64,
-                }
-            )
-        return pl.DataFrame(
-            [
-                {
-                    "etf_ticker": self.ticker,
-                    "holding_ticker": holding.ticker,
-                    "holding_name": holding.name,
-                    "weight": holding.weight,
-                }
-                for holding in self.top_holdings
-            ]
-        )
+        return self._holdings
@@ -1,3 +1,5 @@
+import json
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -5,9 +7,37 @@ import polars as pl
 import yaml
 from loguru import logger
 
-from src.core.domain_models import AllocationItem, ETFComposition, ETFHolding, Sector
+from src.core.domain_models import (
+    ETF_ALLOCATION_SCHEMA,
+    ETF_HOLDING_SCHEMA,
+    AllocationItem,
+    ETFComposition,
+    ETFHolding,
+    Sector,
+)
+from src.core.file_manager import ParquetStorage
 from src.core.normalization import sector_normalization
 
+# Flat row layout of the on-disk ETF cache; holdings reuse "category" for their name
+ETF_CACHE_SCHEMA = {
+    "ticker": pl.Utf8,
+    "kind": pl.Utf8,
+    "category": pl.Utf8,
+    "holding_ticker": pl.Utf8,
+    "weight": pl.Float64,
+}
+
+
+def _stack_frames(frames: list[pl.DataFrame], schema: dict[str, Any]) -> pl.DataFrame:
+    """Stack the per-ETF frames into one contiguous frame.
+
+    All frames share the same schema, so a plain vertical concat with a single
+    rechunk is enough; an empty catalog still yields the typed columns.
+    """
+    if not frames:
+        return pl.DataFrame(schema=schema)
+    return pl.concat(frames, how="vertical", rechunk=True)
+
 
 class ETFLoader:
     """
@@ -29,8 +59,17 @@ class ETFLoader:
             logger.warning(f"ETF Config directory not found at {self.config_dir}")
             return
 
-        # Finde alle .yaml und .yml files rekursiv
-        files = list(self.config_dir.rglob("*.yaml")) + list(self.config_dir.rglob("*.yml"))
+        # Finde alle .yaml und .yml files rekursiv (ein Durchlauf)
+        files = [p for p in self.config_dir.rglob("*") if p.suffix in (".yaml", ".yml")]
+
+        manifest = {
+            str(file_path.relative_to(self.config_dir)): file_path.stat().st_mtime_ns
+            for file_path in files
+        }
+        if self._load_disk_cache(manifest):
+            self._loaded = True
+            logger.info(f"Loaded {len(self._cache)} ETF compositions from cache")
+            return
 
         count = 0
         for file_path in files:
@@ -48,25 +87,113 @@ class ETFLoader:
 
         self._loaded = True
         logger.info(f"Loaded {count} ETF compositions from {len(files)} files in {self.config_dir}")
+        self._write_disk_cache(manifest)
+
+    @property
+    def _cache_dir(self) -> Path:
+        return self.config_dir / ".cache"
+
+    def _load_disk_cache(self, manifest: dict[str, int]) -> bool:
+        """Restore compositions from the sidecar cache if no YAML file changed since."""
+        sidecar_path = self._cache_dir / "etfs.json"
+        parquet_path = self._cache_dir / "etfs.parquet"
+        if not sidecar_path.exists() or not parquet_path.exists():
+            return False
+        try:
+            sidecar = json.loads(sidecar_path.read_text(encoding="utf-8"))
+            if sidecar.get("manifest") != manifest:
+                return False
+
+            allocations = pl.read_parquet(parquet_path).partition_by(
+                "ticker", as_dict=True, include_key=False
+            )
+            empty = pl.DataFrame(schema=ETF_CACHE_SCHEMA)
+            for ticker, info in sidecar["etfs"].items():
+                rows = allocations.get((ticker,), empty)
+                sectors: list[AllocationItem] = []
+                countries: list[AllocationItem] = []
+                holdings: list[ETFHolding] = []
+                # One pass over plain tuples instead of a filter plus dict rows per kind
+                for kind, category, holding_ticker, weight in rows.select(
+                    "kind", "category", "holding_ticker", "weight"
+                ).iter_rows():
+                    if kind == "holding":
+                        holdings.append(
+                            ETFHolding(ticker=holding_ticker, name=category, weight=weight)
+                        )
+                    elif kind == "sector":
+                        sectors.append(AllocationItem(category=sys.intern(category), weight=weight))
+                    elif kind == "country":
+                        countries.append(
+                            AllocationItem(category=sys.intern(category), weight=weight)
+                        )
+                self._cache[sys.intern(ticker)] = ETFComposition(
+                    ticker=ticker,
+                    name=info["name"],
+                    ter=info["ter"],
+                    strategy=info["strategy"],
+                    sector_weights=sectors,
+                    country_weights=countries,
+                    top_holdings=holdings,
+                )
+            return True
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable ETF cache in {self._cache_dir}: {e}")
+            self._cache.clear()
+            return False
+
+    def _write_disk_cache(self, manifest: dict[str, int]) -> None:
+        """Persist parsed compositions so the next start can skip YAML parsing."""
+        allocations = pl.concat(
+            [
+                self.get_all_sectors().with_columns(
+                    pl.lit("sector").alias("kind"), pl.lit(None, pl.Utf8).alias("holding_ticker")
+                ),
+                self.get_all_countries().with_columns(
+                    pl.lit("country").alias("kind"), pl.lit(None, pl.Utf8).alias("holding_ticker")
+                ),
+                self.get_all_top_holdings()
+                .rename({"etf_ticker": "ticker", "holding_name": "category"})
+                .with_columns(pl.lit("holding").alias("kind")),
+            ],
+            how="diagonal",
+        ).select(list(ETF_CACHE_SCHEMA))
+        sidecar = {
+            "manifest": manifest,
+            "etfs": {
+                ticker: {"name": comp.name, "ter": comp.ter, "strategy": comp.strategy}
+                for ticker, comp in self._cache.items()
+            },
+        }
+        try:
+            ParquetStorage(self._cache_dir).atomic_write(allocations, "etfs")
+            tmp_path = self._cache_dir / "etfs.json.tmp"
+            tmp_path.write_text(json.dumps(sidecar), encoding="utf-8")
+            tmp_path.replace(self._cache_dir / "etfs.json")
+        except Exception as e:
+            logger.warning(f"Failed to write ETF cache to {self._cache_dir}: {e}")
 
     def _parse_and_cache(self, ticker: str, data: dict[str, Any]) -> None:
         """Helper to parse raw dict into Pydantic model."""
         try:
             is_percent = data.get("weight_format") == "percent"
-            divisor = 100.0 if is_percent else 1.0
+            scale = 0.01 if is_percent else 1.0
             sectors = []
             for k, v in data.get("sectors", {}).items():
                 norm_sector = sector_normalization(k)
                 if norm_sector is None:
                     norm_sector = Sector.OTHER
-                sectors.append(AllocationItem(category=norm_sector, weight=v / divisor))
+                # Sectors and countries come from small closed sets shared across ETFs
+                sectors.append(
+                    AllocationItem(category=sys.intern(str(norm_sector)), weight=v * scale)
+                )
             countries = [
-                AllocationItem(category=k, weight=v / divisor)
+                AllocationItem(category=sys.intern(k), weight=v * scale)
                 for k, v in data.get("countries", {}).items()
             ]
             holdings = []
             for h in data.get("top_holdings", []):
-                weight = h.get("weight", 0.0) / divisor
+                weight = h.get("weight", 0.0) * scale
                 holding = ETFHolding(
                     ticker=h.get("ticker", ""),
                     name=h.get("name", ""),
@@ -83,7 +210,7 @@ class ETFLoader:
                 country_weights=countries,
                 top_holdings=holdings,
             )
-            self._cache[ticker] = comp
+            self._cache[sys.intern(ticker)] = comp
         except Exception as e:
             logger.error(f"Validation error for {ticker}: {e}")
 
@@ -98,25 +225,22 @@ class ETFLoader:
         """Returns a consolidated DataFrame of ALL ETF sectors."""
         if not self._loaded:
             self.load()
-        dfs = [comp.sectors_df for comp in self._cache.values()]
-        if not dfs:
-            return pl.DataFrame()
-        return pl.concat(dfs)
+        return _stack_frames(
+            [comp.sectors_df for comp in self._cache.values()], ETF_ALLOCATION_SCHEMA
+        )
 
     def get_all_countries(self) -> pl.DataFrame:
         """Returns a consolidated DataFrame of ALL ETF countries."""
         if not self._loaded:
             self.load()
-        dfs = [comp.countries_df for comp in self._cache.values()]
-        if not dfs:
-            return pl.DataFrame()
-        return pl.concat(dfs)
+        return _stack_frames(
+            [comp.countries_df for comp in self._cache.values()], ETF_ALLOCATION_SCHEMA
+        )
 
     def get_all_top_holdings(self) -> pl.DataFrame:
         """Returns a consolidated DataFrame of ALL ETF top holdings."""
         if not self._loaded:
             self.load()
-        dfs = [comp.top_holdings_df for comp in self._cache.values()]
-        if not dfs:
-            return pl.DataFrame()
-        return pl.concat(dfs)
+        return _stack_frames(
+            [comp.top_holdings_df for comp in self._cache.values()], ETF_HOLDING_SCHEMA
+        )
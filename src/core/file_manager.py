@@ -4,6 +4,7 @@ Handles all file I/O operations using Polars DataFrames.
 Atomic writes prevent data corruption by writing to temporary files first.
 """
 
+import os
 from pathlib import Path
 
 import polars as pl
@@ -11,21 +12,36 @@ from loguru import logger
 
 
 class ParquetStorage:
-    """Manages atomic read/write operations for Parquet files."""
+    """Manages atomic read/write operations for Parquet files.
 
-    def __init__(self, base_path: Path, subdirectories: list[str] | None = None) -> None:
+    Data is partitioned by ticker at the filename level (e.g. ``prices_MSFT``),
+    so an update only rewrites the file of the ticker it touches.
+    """
+
+    def __init__(
+        self,
+        base_path: Path,
+        subdirectories: list[str] | None = None,
+        compression_level: int = 3,
+        row_group_size: int = 128_000,
+    ) -> None:
         """Initialize storage with a base directory.
 
         Args:
             base_path: Root directory for all parquet files
             subdirectories: Optional list of subdirectories within the base path
+            compression_level: zstd level used for all writes
+            row_group_size: Rows per parquet row group, bounds predicate pushdown granularity
         """
         self.base_path = Path(base_path)
-        if subdirectories:
-            for subdirectory in subdirectories:
-                (self.base_path / subdirectory).mkdir(parents=True, exist_ok=True)
-        else:
-            self.base_path.mkdir(parents=True, exist_ok=True)
+        self.compression_level = compression_level
+        self.row_group_size = row_group_size
+        # Subdirectories create base_path as their parent; skip the mkdir
+        # syscalls entirely on the usual warm start where everything exists
+        directories = {self.base_path / sub for sub in subdirectories or []} or {self.base_path}
+        for directory in directories:
+            if not directory.is_dir():
+                os.makedirs(directory, exist_ok=True)
         logger.info(f"ParquetStorage initialized at {self.base_path}")
 
     def atomic_update(
@@ -50,15 +66,24 @@ class ParquetStorage:
         target_path = self.base_path / filename
 
         if target_path.exists():
-            # Read existing data
-            existing_df = pl.read_parquet(target_path)
-            history_to_keep = existing_df.join(
-                df.select(unique_keys),
-                on=unique_keys,
-                how="anti",
+            # Lazy anti-join so only rows that survive the update get materialized
+            history_to_keep = (
+                pl.scan_parquet(target_path)
+                .join(
+                    df.lazy().select(unique_keys),
+                    on=unique_keys,
+                    how="anti",
+                )
+                .collect()
             )
-            # Combine and deduplicate
-            combined_df = pl.concat([df, history_to_keep], how="diagonal_relaxed").sort(unique_keys)
+            # Combine and deduplicate; identical schemas (the usual append case)
+            # can skip the diagonal re-alignment and just stack the chunks
+            if df.schema == history_to_keep.schema:
+                combined_df = df.vstack(history_to_keep).sort(unique_keys)
+            else:
+                combined_df = pl.concat([df, history_to_keep], how="diagonal_relaxed").sort(
+                    unique_keys
+                )
         else:
             combined_df = df.sort(unique_keys)
 
@@ -78,23 +103,36 @@ class ParquetStorage:
         tmp_path = self.base_path / f"{filename}.tmp"
 
         try:
-            # Write to temporary file
-            df.write_parquet(tmp_path)
+            # Write to temporary file and flush it to disk before the rename,
+            # otherwise a crash can leave a renamed but torn file behind
+            with open(tmp_path, "wb") as f:
+                df.write_parquet(
+                    f,
+                    compression="zstd",
+                    compression_level=self.compression_level,
+                    statistics=True,
+                    row_group_size=self.row_group_size,
+                )
+                f.flush()
+                os.fsync(f.fileno())
             logger.debug(f"Wrote temporary file: {tmp_path}")
 
             # Atomic rename (overwrites target if it exists)
-            tmp_path.replace(target_path)
+            os.replace(tmp_path, target_path)
             logger.info(f"Atomically wrote {len(df)} rows to {target_path}")
 
         except Exception as e:
             # Clean up temporary file on failure
-            if tmp_path.exists():
-                tmp_path.unlink()
+            tmp_path.unlink(missing_ok=True)
             logger.error(f"Failed to write {filename}: {e}")
             raise
 
-    def read(self, filename: str) -> pl.DataFrame:
-        """Read parquet file into a Polars DataFrame."""
+    def scan(self, filename: str) -> pl.LazyFrame:
+        """Lazily scan a parquet file.
+
+        Nothing is decoded until the caller collects, and aggregates such as a
+        column max can be answered from the row group statistics alone.
+        """
         if not filename.endswith(".parquet"):
             filename += ".parquet"
         target_path = self.base_path / filename
@@ -102,7 +140,25 @@ class ParquetStorage:
         if not target_path.exists():
             logger.warning(f"File not found: {target_path}")
             raise FileNotFoundError(f"No parquet file found: {filename}")
-        data = pl.read_parquet(target_path)
+        return pl.scan_parquet(target_path)
+
+    def read(
+        self,
+        filename: str,
+        columns: list[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
+        """Read parquet file into a Polars DataFrame.
+
+        Optional column selection and row predicate are pushed down into the
+        parquet scan, so callers needing a slice never load the full file.
+        """
+        lf = self.scan(filename)
+        if predicate is not None:
+            lf = lf.filter(predicate)
+        if columns:
+            lf = lf.select(columns)
+        data = lf.collect()
 
         logger.info(f"Read {len(data)} rows from {filename}")
 
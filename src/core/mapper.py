@@ -5,9 +5,15 @@ This module bridges the gap between raw data (yfinance pandas DataFrames)
 and our internal domain representation (Polars DataFrames + Pydantic models).
 """
 
+import os
+import sys
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, TypeGuard, TypeVar
 
+import numpy as np
 import pandas as pd
 import polars as pl
 from loguru import logger
@@ -21,6 +27,193 @@ from src.core.domain_models import (
     Sector,
 )
 
+_Number = TypeVar("_Number", float, int)
+
+# Synonyms per canonical sector name, flattened into _SECTOR_LOOKUP at import
+SECTOR_SYNONYMS: dict[str, list[str]] = {
+    "Technology": ["Tech"],
+    "Healthcare": ["Health Care"],
+    "Financials": ["Finance", "Financial Services"],
+    "Consumer Discretionary": [
+        "Consumer Services",
+        "Consumer Cyclical",
+        "Discretionary",
+    ],
+    "Communication": [
+        "Communication Services",
+        "Telecommunication",
+        "Telecom",
+        "Communications",
+    ],
+    "Industrials": ["Industrial Goods"],
+    "Consumer Staples": ["Staples", "Consumer Defensive"],
+    "Energy": ["Oil & Gas"],
+    "Utilities": ["Utilities"],
+    "Real Estate": ["Property"],
+    "Materials": ["Basic Materials"],
+}
+
+_SECTOR_LOOKUP: dict[str, Sector] = {
+    sys.intern(name.strip().casefold()): Sector(sector)
+    for sector, synonyms in SECTOR_SYNONYMS.items()
+    for name in [sector, *synonyms]
+}
+
+
+# yfinance row labels (lowercased) per FinancialReport field, in order of preference
+FIELD_ALIASES: dict[str, tuple[str, ...]] = {
+    # Income Statement
+    "revenue": ("total revenue", "revenue", "operating revenue"),
+    "gross_profit": ("gross profit", "gross income"),
+    "ebit": (
+        "ebit",
+        "earnings before interest and tax",
+        "operating income",
+        "operating profit",
+    ),
+    "net_income": (
+        "net income",
+        "net income common stockholders",
+        "net income from continuing operations",
+    ),
+    "tax_provision": (
+        "tax provision",
+        "tax expense",
+        "income tax expense",
+        "provision for income taxes",
+    ),
+    "interest_expense": (
+        "interest expense",
+        "interest expenses",
+        "interest expense non operating",
+        "total interest expense",
+    ),
+    "diluted_eps": (
+        "diluted eps",
+        "diluted earnings per share",
+        "earnings per share diluted",
+    ),
+    "basic_eps": ("basic eps", "basic earnings per share"),
+    # Cash Flow
+    "operating_cash_flow": ("operating cash flow", "total cash from operating activities"),
+    # Note: Yahoo returns Capex as NEGATIVE numbers. We keep it raw here.
+    "capital_expenditure": (
+        "capital expenditure",
+        "capital expenditures",
+        "purchase of property, plant and equipment",
+        "purchase of ppe",
+    ),
+    "free_cash_flow": ("free cash flow",),
+    "cash_dividends_paid": (
+        "cash dividends paid",
+        "dividends paid",
+        "common stock dividends paid",
+    ),
+    # Shares
+    "basic_average_shares": ("basic average shares", "ordinary shares number"),
+    "diluted_average_shares": ("diluted average shares", "ordinary shares number"),
+    # Balance Sheet
+    "total_assets": ("total assets",),
+    "total_current_liabilities": ("total current liabilities", "current liabilities"),
+    "total_equity": (
+        "total equity",
+        "stockholders equity",
+        "total stockholder equity",
+        "total equity and gross minority interest",
+    ),
+    "long_term_debt": (
+        "long term debt",
+        "long-term debt",
+        "long term debt and capital lease obligations",
+    ),
+    "short_term_debt": (
+        "current debt",
+        "current debt and capital lease obligations",
+        "commercial paper",
+        "short term debt",
+    ),
+    "total_debt": (
+        "total debt",
+        "total debt and capital lease obligations",
+        "debt",
+    ),
+    "cash_and_equivalents": ("cash and cash equivalents", "cash"),
+    "goodwill": ("goodwill",),
+    "intangible_assets": ("intangible assets", "other intangible assets"),
+    "goodwill_and_other_intangible_assets": ("goodwill and other intangible assets",),
+    "share_issued": (
+        "share issued",
+        "shares issued",
+        "ordinary shares number",
+        "common shares outstanding",
+        "common stock shares outstanding",
+    ),
+}
+
+
+@lru_cache(maxsize=32)
+def _resolve_fields(columns: frozenset[str]) -> dict[str, tuple[str, ...]]:
+    """
+    Return the aliases present in `columns` for every FinancialReport field.
+
+    yfinance almost always returns the same row labels, so the resolution is
+    cached per column set and shared across tickers. Treat the result as read-only.
+    """
+    return {
+        field: tuple(alias for alias in aliases if alias in columns)
+        for field, aliases in FIELD_ALIASES.items()
+    }
+
+
+# yfinance info keys per AssetMetadata field, in order of preference
+INFO_ALIASES: dict[str, tuple[str, ...]] = {
+    "ticker": ("symbol", "ticker"),
+    "name": ("longName", "shortName", "displayName", "name", "ticker"),
+    "short_name": ("shortName", "displayName"),
+    "display_name": ("displayName",),
+    "exchange": ("exchange", "exchangeName"),
+    "currency": ("currency",),
+    "country": ("country", "countryOfIncorporation"),
+    "sector": ("sector", "sectorDisp", "sectorKey"),
+    "industry": ("industry", "industryDisp", "industryKey"),
+}
+
+# Important metrics for quick analysis, we cannot get them in the fundamentals
+INFO_FLOAT_KEYS: dict[str, tuple[str, ...]] = {
+    "forward_pe": ("forwardPE",),
+    "forward_eps": ("forwardEps",),
+    "trailing_pe": ("trailingPE",),
+    "trailing_eps": ("trailingEps",),
+    "trailing_peg_ratio": ("trailingPegRatio",),
+    "earnings_growth": ("earningsGrowth",),
+    "revenue_growth": ("revenueGrowth",),
+    "ebitda_margin": ("ebitdaMargins",),
+}
+INFO_INT_KEYS: dict[str, tuple[str, ...]] = {
+    "number_of_analyst_opinions": ("numberOfAnalystOpinions",),
+}
+
+CALENDAR_ALIASES: dict[str, tuple[str, ...]] = {
+    "dividend_date": ("Dividend Date", "dividendDate"),
+    "earnings_date": ("Earnings Date", "earningsDate"),
+}
+
+# Normalized info/calendar keys read by the metadata mapping, including the
+# quoteType/fundFamily lookups of map_asset_type
+_METADATA_INFO_KEYS = frozenset(
+    key.strip().casefold()
+    for aliases in (
+        *INFO_ALIASES.values(),
+        *INFO_FLOAT_KEYS.values(),
+        *INFO_INT_KEYS.values(),
+        ("quoteType", "fundFamily"),
+    )
+    for key in aliases
+)
+_METADATA_CALENDAR_KEYS = frozenset(
+    key.strip().casefold() for aliases in CALENDAR_ALIASES.values() for key in aliases
+)
+
 
 def map_sector(sector_str: str | None) -> Sector | None:
     """
@@ -35,36 +228,10 @@ def map_sector(sector_str: str | None) -> Sector | None:
     if not sector_str:
         return None
 
-    sector_synonyms = {
-        "Technology": ["Tech"],
-        "Healthcare": ["Health Care"],
-        "Financials": ["Finance", "Financial Services"],
-        "Consumer Discretionary": [
-            "Consumer Services",
-            "Consumer Cyclical",
-            "Discretionary",
-        ],
-        "Communication": [
-            "Communication Services",
-            "Telecommunication",
-            "Telecom",
-            "Communications",
-        ],
-        "Industrials": ["Industrial Goods"],
-        "Consumer Staples": ["Staples", "Consumer Defensive"],
-        "Energy": ["Oil & Gas"],
-        "Utilities": ["Utilities"],
-        "Real Estate": ["Property"],
-        "Materials": ["Basic Materials"],
-    }
-
-    tmp_str = sector_str.lower().strip()
-    for sector, synonyms in sector_synonyms.items():
-        if tmp_str == sector.lower().strip() or tmp_str in [s.lower().strip() for s in synonyms]:
-            return Sector(sector)
-
-    logger.warning(f"Unrecognized sector '{sector_str}'")
-    return None
+    sector = _SECTOR_LOOKUP.get(sector_str.strip().casefold())
+    if sector is None:
+        logger.warning(f"Unrecognized sector '{sector_str}'")
+    return sector
 
 
 def map_asset_type(info: dict[str, str]) -> AssetType:
@@ -123,52 +290,104 @@ def map_ticker_info_to_asset_metadata(
     """
     Map yfinance ticker info dictionary to AssetMetadata domain model.
 
+    Payloads that agree on the fields read here are served from an LRU cache;
+    AssetMetadata is frozen, so sharing the instance is safe.
+
     Args:
         info: Dictionary from yfinance.Ticker.info
 
     Returns:
         AssetMetadata domain object
     """
+    # Key the cache on the fields the mapper reads, not on the whole payload:
+    # live quote fields would make every re-fetch a miss, and the full dicts
+    # (officer lists and all) would stay pinned in the cache
+    info = _project(info, _METADATA_INFO_KEYS)
+    calendar = _project(calendar, _METADATA_CALENDAR_KEYS) if calendar is not None else None
+    try:
+        frozen_info = _freeze(info)
+        frozen_calendar = _freeze(calendar) if calendar is not None else None
+        hash((frozen_info, frozen_calendar))
+    except TypeError:
+        # Some value is unhashable even after freezing, map without the cache
+        return _map_asset_metadata(info, calendar)
+    return _cached_asset_metadata(frozen_info, frozen_calendar)
+
+
+# Roughly one entry per ticker of the configured universe
+@lru_cache(maxsize=512)
+def _cached_asset_metadata(
+    frozen_info: frozenset[tuple[str, Any]],
+    frozen_calendar: frozenset[tuple[str, Any]] | None,
+) -> AssetMetadata:
+    calendar = dict(frozen_calendar) if frozen_calendar is not None else None
+    return _map_asset_metadata(dict(frozen_info), calendar)
+
+
+def _project(data: dict[str, Any], keys: frozenset[str]) -> dict[str, Any]:
+    """Entries of `data` whose normalized key is in `keys` (see _build_lookup)."""
+    return {
+        key: value
+        for key, value in data.items()
+        if isinstance(key, str) and key.strip().casefold() in keys
+    }
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts and lists into frozensets and tuples for cache keys."""
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _map_asset_metadata(info: dict[str, Any], calendar: dict[str, Any] | None) -> AssetMetadata:
     asset_type = map_asset_type(info)
-    sector = map_sector(_safe_str(info, ["sector", "sectorDisp", "sectorKey"]))
-    short_name = _safe_str(info, ["shortName", "displayName"])
+    # Build the case-insensitive key index once for all lookups below
+    info_lookup = _build_lookup(info.keys())
+    strings = {field: _safe_str(info, keys, info_lookup) for field, keys in INFO_ALIASES.items()}
+    floats = {field: _get_float(info, keys) for field, keys in INFO_FLOAT_KEYS.items()}
+    ints = {field: _get_int(info, keys) for field, keys in INFO_INT_KEYS.items()}
+    short_name = strings["short_name"]
     if short_name:
         short_name = short_name.replace("   I", "").strip()
-    name = _safe_str(info, ["longName", "shortName", "displayName", "name", "ticker"])
+    name = strings["name"]
     if calendar is not None:
-        dividend_date = _safe_date(calendar, ["Dividend Date", "dividendDate"])
-        earnings_date = _safe_date(calendar, ["Earnings Date", "earningsDate"])
+        calendar_lookup = _build_lookup(calendar.keys())
+        dates = {
+            field: _safe_date(calendar, keys, calendar_lookup)
+            for field, keys in CALENDAR_ALIASES.items()
+        }
     else:
-        dividend_date = None
-        earnings_date = None
+        dates = dict.fromkeys(CALENDAR_ALIASES, None)
     if name:
         name = name.replace("   I", "").strip()
     else:
         name = "Unknown"
     asset_metadata = AssetMetadata(
-        ticker=_safe_str(info, ["symbol", "ticker"]) or "UNKNOWN",
+        ticker=strings["ticker"] or "UNKNOWN",
         name=name,
         asset_type=asset_type,
         short_name=short_name,
-        exchange=_safe_str(info, ["exchange", "exchangeName"]),
-        currency=_safe_str(info, ["currency"]) or "USD",
-        country=_safe_str(info, ["country", "countryOfIncorporation"]),
-        sector_raw=_safe_str(info, ["sector", "sectorDisp", "sectorKey"]),
-        sector=sector,
-        industry=_safe_str(info, ["industry", "industryDisp", "industryKey"]),
-        # important metrics for quick analysis, we cannot get them in the fundamentals
-        forward_pe=_get_float(info, ["forwardPE"]),
-        forward_eps=_get_float(info, ["forwardEps"]),
-        number_of_analyst_opinions=_get_int(info, ["numberOfAnalystOpinions"]),
-        trailing_pe=_get_float(info, ["trailingPE"]),
-        trailing_eps=_get_float(info, ["trailingEps"]),
-        trailing_peg_ratio=_get_float(info, ["trailingPegRatio"]),
-        earnings_growth=_get_float(info, ["earningsGrowth"]),
-        revenue_growth=_get_float(info, ["revenueGrowth"]),
-        ebitda_margin=_get_float(info, ["ebitdaMargins"]),
-        display_name=_safe_str(info, ["displayName"]),
-        dividend_date=dividend_date,
-        earnings_date=earnings_date,
+        exchange=strings["exchange"],
+        currency=strings["currency"] or "USD",
+        country=strings["country"],
+        sector_raw=strings["sector"],
+        sector=map_sector(strings["sector"]),
+        industry=strings["industry"],
+        forward_pe=floats["forward_pe"],
+        forward_eps=floats["forward_eps"],
+        number_of_analyst_opinions=ints["number_of_analyst_opinions"],
+        trailing_pe=floats["trailing_pe"],
+        trailing_eps=floats["trailing_eps"],
+        trailing_peg_ratio=floats["trailing_peg_ratio"],
+        earnings_growth=floats["earnings_growth"],
+        revenue_growth=floats["revenue_growth"],
+        ebitda_margin=floats["ebitda_margin"],
+        display_name=strings["display_name"],
+        dividend_date=dates["dividend_date"],
+        earnings_date=dates["earnings_date"],
     )
     logger.debug(f"Mapped AssetMetadata for {asset_metadata.name} ({asset_metadata.exchange})")
     return asset_metadata
@@ -189,58 +408,92 @@ def map_prices_to_df(pdf: pd.DataFrame, ticker: str, currency: str) -> pl.DataFr
     pdf_reset = pdf.reset_index()
 
     # remove multi-index and lowercase columns
-    pdf_reset.columns = [col[0].lower() for col in pdf_reset.columns]
-
-    # Convert to Polars immediately
-    prices = pl.from_pandas(pdf_reset)
-
-    # Add ticker column
-    prices = prices.with_columns(
-        pl.lit(ticker).alias("ticker"),
-        pl.lit(currency).alias("currency"),
-        pl.col("date").cast(pl.Date),
+    pdf_reset.columns = pdf_reset.columns.get_level_values(0).str.lower()
+
+    # Convert to Polars immediately, straight from the numpy buffers
+    prices = pl.DataFrame(
+        [
+            pl.Series(name, _column_to_numpy(pdf_reset[name]), nan_to_null=True)
+            for name in pdf_reset.columns
+        ]
     )
 
-    if "dividends" in prices.columns:
-        prices = prices.rename({"dividends": "dividend"})
-    else:
-        prices = prices.with_columns(pl.lit(0.0).alias("dividend"))
-    prices = prices.with_columns(pl.col("dividend").fill_null(0.0))
-
+    # Resolve column name variations up front so the whole mapping runs as a
+    # single lazy query and only the final frame gets materialized
+    columns = set(prices.columns)
+    renames = {}
     # Ensure Date column exists (might be named differently)
-    if "date" not in prices.columns and "index" in prices.columns:
-        prices = prices.rename({"index": "date"})
-
+    if "date" not in columns and "index" in columns:
+        renames["index"] = "date"
     # Handle adj_close column name variation
-    if "adj close" in prices.columns and "adj_close" not in prices.columns:
-        prices = prices.rename({"adj close": "adj_close"})
-    if "adj_close" not in prices.columns:
-        # If adj_close is missing, close is already adjusted itself hence copy close to adj_close
-        prices = prices.with_columns(pl.col("close").alias("adj_close"))
+    if "adj close" in columns and "adj_close" not in columns:
+        renames["adj close"] = "adj_close"
+    columns = {renames.get(name, name) for name in columns}
+
+    # Missing or null dividends mean no payout that day
+    dividend = pl.col("dividends") if "dividends" in columns else pl.lit(None, pl.Float64)
+
+    ldf = (
+        prices.lazy()
+        .rename(renames)
+        .with_columns(
+            # Add ticker column
+            pl.lit(ticker).alias("ticker"),
+            pl.lit(currency).alias("currency"),
+            pl.col("date").cast(pl.Date),
+            pl.coalesce(dividend, pl.lit(0.0)).alias("dividend"),
+            # Without adj_close, close is already adjusted itself hence copy close
+            pl.col("adj_close" if "adj_close" in columns else "close").alias("adj_close"),
+        )
+    )
 
     # Select required columns and cast to STOCK_PRICE_SCHEMA
-    prices = prices.select([pl.col(name).cast(dtype) for name, dtype in STOCK_PRICE_SCHEMA.items()])
+    prices = ldf.select(list(STOCK_PRICE_SCHEMA)).cast(pl.Schema(STOCK_PRICE_SCHEMA)).collect()
 
     logger.debug(f"Mapped {len(prices)} price rows for {ticker}")
     return prices
 
 
+def _column_to_numpy(column: pd.Series) -> np.ndarray:
+    """numpy has no tz-aware dtype, so tz-aware timestamps keep their local wall time."""
+    if isinstance(column.dtype, pd.DatetimeTZDtype):
+        column = column.dt.tz_localize(None)
+    return column.to_numpy()
+
+
+def _column_to_float(column: pd.Series) -> np.ndarray:
+    """Float64 values of a statement metric; unparseable entries become NaN.
+
+    Object and string columns may hold thousands-separated numbers ("1,000"),
+    which are accepted the same way as in _get_float.
+    """
+    if not pd.api.types.is_numeric_dtype(column):
+        column = column.map(
+            lambda value: value.replace(",", "") if isinstance(value, str) else value
+        )
+    return pd.to_numeric(column, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+
 def map_fundamentals_to_domain(
     pdf: pd.DataFrame,
     ticker: str,
     report_type: ReportType,
     currency: str,
+    validate: bool = False,
 ) -> list[FinancialReport]:
     """
     Transform yfinance financial statements to domain models.
 
     yfinance returns transposed data (metrics as rows, dates as columns).
-    We transpose it to have dates as rows for iteration.
+    We transpose it to have dates as rows and resolve all fields column-wise
+    in Polars, so the per-report loop only builds the domain objects.
 
     Args:
         pdf: Raw pandas DataFrame from yfinance (quarterly_financials, etc.)
         ticker: Stock ticker symbol
         report_type: ANNUAL or QUARTERLY
+        validate: Run full Pydantic validation per report. Off by default since
+            all fields are already coerced to floats above.
 
     Returns:
         List of FinancialReport domain objects
@@ -254,168 +507,60 @@ def map_fundamentals_to_domain(
 
     # Normalize column names to lowercase and strip whitespace
     pdf_transposed.columns = pdf_transposed.columns.str.lower().str.strip()
+    pdf_transposed = pdf_transposed.loc[:, ~pdf_transposed.columns.duplicated()]
+
+    # Parse and validate all report dates at once (yfinance returns a datetime-like index)
+    report_dates = pd.to_datetime(pdf_transposed.index, errors="coerce")
+    for label in pdf_transposed.index[report_dates.isna()]:
+        logger.error(f"Failed to map report for {ticker} at {label}: unparseable report date")
+    valid = np.asarray(report_dates.notna())
+    pdf_transposed, report_dates = pdf_transposed.loc[valid], report_dates[valid]
+
+    future = report_dates.date > datetime.now().date()
+    for future_date in report_dates.date[future]:
+        logger.warning(f"Skipping future report date {future_date} for {ticker}")
+    pdf_transposed, report_dates = pdf_transposed.loc[~future], report_dates[~future]
+
+    if pdf_transposed.empty:
+        logger.info(f"Mapped 0 {report_type} reports for {ticker}")
+        return []
 
-    reports = []
+    # yfinance column names vary slightly, so each field takes the first
+    # non-null value among its aliases, row by row
+    resolved = _resolve_fields(frozenset(pdf_transposed.columns))
+    used = dict.fromkeys(alias for aliases in resolved.values() for alias in aliases)
+
+    # Only the aliased metrics are converted, each straight from its numpy
+    # values; no pyarrow round-trip and no copy of the columns nobody reads
+    raw = pl.DataFrame(
+        [
+            pl.Series("__report_date", report_dates.date.tolist(), dtype=pl.Date),
+            *(
+                pl.Series(alias, _column_to_float(pdf_transposed[alias]), nan_to_null=True)
+                for alias in used
+            ),
+        ]
+    )
 
-    for report_date, row in pdf_transposed.iterrows():
-        try:
-            # Parse date (yfinance returns datetime-like index)
-            if isinstance(report_date, pd.Timestamp):
-                parsed_date = report_date.date()
-            elif isinstance(report_date, datetime):
-                parsed_date = report_date.date()
-            else:
-                parsed_date = pd.to_datetime(report_date).date()
-
-            if parsed_date > datetime.now().date():
-                logger.warning(f"Skipping future report date {parsed_date} for {ticker}")
-                continue
+    fields = []
+    for field, aliases in resolved.items():
+        present = [pl.col(alias) for alias in aliases]
+        expr = pl.coalesce(present) if present else pl.lit(None, dtype=pl.Float64)
+        fields.append(expr.alias(field))
+    values = raw.select(pl.col("__report_date"), *fields)
 
-            row_data = row.to_dict()
+    reports = []
+    build_report = FinancialReport if validate else FinancialReport.model_construct
 
-            # Map yfinance keys to domain model fields
-            # Note: yfinance column names can vary slightly
-            report = FinancialReport(
+    for row in values.iter_rows(named=True):
+        parsed_date = row.pop("__report_date")
+        try:
+            report = build_report(
                 ticker=ticker,
                 report_date=parsed_date,
                 period_type=report_type,
                 currency=currency,
-                # Income Statement
-                revenue=_get_float(row_data, ["total revenue", "revenue", "operating revenue"]),
-                gross_profit=_get_float(row_data, ["gross profit", "gross income"]),
-                ebit=_get_float(
-                    row_data,
-                    [
-                        "ebit",
-                        "earnings before interest and tax",
-                        "operating income",
-                        "operating profit",
-                    ],
-                ),
-                net_income=_get_float(
-                    row_data,
-                    [
-                        "net income",
-                        "net income common stockholders",
-                        "net income from continuing operations",
-                    ],
-                ),
-                tax_provision=_get_float(
-                    row_data,
-                    [
-                        "tax provision",
-                        "tax expense",
-                        "income tax expense",
-                        "provision for income taxes",
-                    ],
-                ),
-                interest_expense=_get_float(
-                    row_data,
-                    [
-                        "interest expense",
-                        "interest expenses",
-                        "interest expense non operating",
-                        "total interest expense",
-                    ],
-                ),
-                diluted_eps=_get_float(
-                    row_data,
-                    [
-                        "diluted eps",
-                        "diluted earnings per share",
-                        "earnings per share diluted",
-                    ],
-                ),
-                basic_eps=_get_float(row_data, ["basic eps", "basic earnings per share"]),
-                # Cash Flow
-                operating_cash_flow=_get_float(
-                    row_data,
-                    ["operating cash flow", "total cash from operating activities"],
-                ),
-                # Note: Yahoo returns Capex as NEGATIVE numbers.
-                # We keep it raw here.
-                capital_expenditure=_get_float(
-                    row_data,
-                    [
-                        "capital expenditure",
-                        "capital expenditures",
-                        "purchase of property, plant and equipment",
-                        "purchase of ppe",
-                    ],
-                ),
-                free_cash_flow=_get_float(row_data, ["free cash flow"]),
-                cash_dividends_paid=_get_float(
-                    row_data,
-                    [
-                        "cash dividends paid",
-                        "dividends paid",
-                        "common stock dividends paid",
-                    ],
-                ),
-                # Shares
-                basic_average_shares=_get_float(
-                    row_data, ["basic average shares", "ordinary shares number"]
-                ),
-                diluted_average_shares=_get_float(
-                    row_data, ["diluted average shares", "ordinary shares number"]
-                ),
-                # Balance Sheet
-                total_assets=_get_float(row_data, ["total assets"]),
-                total_current_liabilities=_get_float(
-                    row_data, ["total current liabilities", "current liabilities"]
-                ),
-                total_equity=_get_float(
-                    row_data,
-                    [
-                        "total equity",
-                        "stockholders equity",
-                        "total stockholder equity",
-                        "total equity and gross minority interest",
-                    ],
-                ),
-                long_term_debt=_get_float(
-                    row_data,
-                    [
-                        "long term debt",
-                        "long-term debt",
-                        "long term debt and capital lease obligations",
-                    ],
-                ),
-                short_term_debt=_get_float(
-                    row_data,
-                    [
-                        "current debt",
-                        "current debt and capital lease obligations",
-                        "commercial paper",
-                        "short term debt",
-                    ],
-                ),
-                total_debt=_get_float(
-                    row_data,
-                    [
-                        "total debt",
-                        "total debt and capital lease obligations",
-                        "debt",
-                    ],
-                ),
-                cash_and_equivalents=_get_float(row_data, ["cash and cash equivalents", "cash"]),
-                goodwill=_get_float(row_data, ["goodwill"]),
-                intangible_assets=_get_float(
-                    row_data, ["intangible assets", "other intangible assets"]
-                ),
-                goodwill_and_other_intangible_assets=_get_float(
-                    row_data, ["goodwill and other intangible assets"]
-                ),
-                share_issued=_get_float(
-                    row_data,
-                    [
-                        "share issued",
-                        "shares issued",
-                        "ordinary shares number",
-                        "common shares outstanding",
-                        "common stock shares outstanding",
-                    ],
-                ),
+                **row,
             )
 
             # Quality check: skip reports with future dates
@@ -427,76 +572,122 @@ def map_fundamentals_to_domain(
                 continue
 
             reports.append(report)
-            logger.debug(f"Mapped {report_type} report for {ticker} on {parsed_date}")
+            # Positional args defer formatting until a sink actually accepts DEBUG
+            logger.debug("Mapped {} report for {} on {}", report_type, ticker, parsed_date)
 
         except Exception as e:
-            logger.error(f"Failed to map report for {ticker} at {report_date}: {e}")
+            logger.error(f"Failed to map report for {ticker} at {parsed_date}: {e}")
             continue
 
     logger.info(f"Mapped {len(reports)} {report_type} reports for {ticker}")
     return reports
 
 
-def _get_float(data: dict[str, Any], keys: list[str]) -> float | None:
-    for key in keys:
-        value = data.get(key, None)
-        if pd.notna(value):
-            try:
-                if isinstance(value, str):
-                    return float(value.replace(",", ""))
-                return float(value)
-            except (ValueError, TypeError):
-                continue
-    return None
+def map_fundamentals_batch(
+    jobs: list[tuple[pd.DataFrame, str, ReportType, str]],
+) -> list[list[FinancialReport]]:
+    """
+    Map several (pdf, ticker, report_type, currency) jobs concurrently.
+
+    Jobs are independent and most of the work happens in pandas/Polars
+    conversions that release the GIL, so a thread pool scales well here.
+
+    Returns:
+        One list of FinancialReport objects per job, in job order
+    """
+    if not jobs:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+        return list(pool.map(lambda job: map_fundamentals_to_domain(*job), jobs))
+
+
+def _get_float(data: dict[str, Any], keys: Sequence[str]) -> float | None:
+    return _get_number(data, keys, float)
 
 
-def _get_int(data: dict[str, Any], keys: list[str]) -> int | None:
+def _get_int(data: dict[str, Any], keys: Sequence[str]) -> int | None:
+    return _get_number(data, keys, int)
+
+
+def _get_number(
+    data: dict[str, Any], keys: Sequence[str], convert: Callable[[Any], _Number]
+) -> _Number | None:
+    """First value among `keys` that converts cleanly; strings may use thousands separators."""
+    if not data:
+        return None
     for key in keys:
         value = data.get(key, None)
-        if pd.notna(value):
+        if _notna(value):
             try:
                 if isinstance(value, str):
-                    return int(value.replace(",", ""))
-                return int(value)
+                    return convert(value.replace(",", ""))
+                return convert(value)
             except (ValueError, TypeError):
                 continue
     return None
 
 
-def _safe_date(data: dict[str, Any], keys: list[str]) -> date | None:
-    lookup_map = {idx.strip().lower(): idx for idx in data.keys() if isinstance(idx, str)}
+def _notna(value: Any) -> TypeGuard[Any]:
+    """Scalar null check; pd.notna dispatches on type and costs far more per call."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return False
+    return not (isinstance(value, float) and value != value)
+
+
+def _build_lookup(keys: Iterable[Any]) -> dict[str, str]:
+    """Map normalized key -> original key for case-insensitive lookups."""
+    return {idx.strip().casefold(): idx for idx in keys if isinstance(idx, str)}
+
+
+def _safe_date(
+    data: dict[str, Any], keys: Sequence[str], lookup_map: dict[str, str] | None = None
+) -> date | None:
+    if not data:
+        return None
     for key in keys:
-        key_clean = key.strip().lower()
-        if key_clean in lookup_map:
-            original_key = lookup_map[key_clean]
-            value = data.get(original_key, None)
-            # 1. Handle Nulls / NaNs
-            if value is None:
+        if key in data:
+            original_key = key
+        else:
+            if lookup_map is None:
+                lookup_map = _build_lookup(data.keys())
+            key_clean = key.strip().casefold()
+            if key_clean not in lookup_map:
                 continue
-            if isinstance(value, float) and (pd.isna(value) or value != value):
+            original_key = lookup_map[key_clean]
+        value = data.get(original_key, None)
+
+        # 1. Handle Lists (unpack first element; cached payloads carry tuples)
+        if isinstance(value, list | tuple):
+            if not value:
                 continue
+            value = value[0]
 
-            # 2. Handle Lists (unpack first element)
-            if isinstance(value, list):
-                if not value:
-                    continue
-                value = value[0]
+        # 2. Handle Nulls / NaNs
+        if not _notna(value):
+            continue
 
-            # 3. Try parsing whatever is left (String, Timestamp, Int, etc.)
-            try:
-                # pandas to_datetime is the most robust parser we have
-                dt_val = pd.to_datetime(value)
+        # 3. Already date-like (Timestamp subclasses datetime, datetime subclasses date)
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
 
-                # Check if the result is valid (not NaT)
-                if pd.notna(dt_val):
-                    return dt_val.date()  # type: ignore[no-any-return]
-            except (ValueError, TypeError):
-                continue
+        # 4. Try parsing whatever is left (String, Int, etc.)
+        try:
+            # pandas to_datetime is the most robust parser we have
+            dt_val = pd.to_datetime(value)
+        except (ValueError, TypeError):
+            continue
+        # Check if the result is valid (not NaT)
+        if _notna(dt_val):
+            return dt_val.date()  # type: ignore[no-any-return]
 
     return None
 
 
-def _safe_str(data: dict[str, str], keys: list[str]) -> str | None:
+def _safe_str(
+    data: dict[str, str], keys: Sequence[str], lookup_map: dict[str, str] | None = None
+) -> str | None:
     """
     Extract string value from pandas Series using multiple possible keys.
     Due to variations in yfinance column names, we try several options.
@@ -505,18 +696,27 @@ def _safe_str(data: dict[str, str], keys: list[str]) -> str | None:
     Args:
         row: pandas Series (one row from transposed DataFrame)
         keys: List of possible column names to try (case-insensitive)
+        lookup_map: Prebuilt result of `_build_lookup` when querying the same data repeatedly
 
     Returns:
         String value if found, None otherwise
     """
-    # Create lowercase index for case-insensitive lookup
-    lookup_map = {idx.strip().lower(): idx for idx in data.keys() if isinstance(idx, str)}
+    if not data:
+        return None
 
     for key in keys:
-        key_clean = key.strip().lower()
-        if key_clean in lookup_map:
+        # Exact-cased hits are the common case and need no lookup index
+        if key in data:
+            original_key = key
+        else:
+            # Create lowercase index for case-insensitive lookup on first miss
+            if lookup_map is None:
+                lookup_map = _build_lookup(data.keys())
+            key_clean = key.strip().casefold()
+            if key_clean not in lookup_map:
+                continue
             original_key = lookup_map[key_clean]
-            value = data.get(original_key, None)
-            if pd.notna(value):
-                return str(value)
+        value = data.get(original_key, None)
+        if _notna(value):
+            return str(value)
     return None
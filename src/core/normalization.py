@@ -1,6 +1,9 @@
+import sys
+from functools import lru_cache
+
 from src.core.domain_models import Sector
 
-SECTOR_SYNONYMS: dict[str, str] = {
+SECTOR_SYNONYMS: dict[str, Sector] = {
     "information technology": Sector.TECHNOLOGY,
     "tech": Sector.TECHNOLOGY,
     "it": Sector.TECHNOLOGY,
@@ -31,16 +34,18 @@ SECTOR_SYNONYMS: dict[str, str] = {
     "realty": Sector.REAL_ESTATE,
     "reit": Sector.REAL_ESTATE,
 }
+# Interned keys let dict lookups short-circuit on identity for repeated labels
+SECTOR_SYNONYMS = {sys.intern(k): v for k, v in SECTOR_SYNONYMS.items()}
+
+# Canonical enum values by normalized name, so misses are a dict miss instead of a ValueError
+_CANONICAL: dict[str, Sector] = {s.value.strip().casefold(): s for s in Sector}
 
 
+@lru_cache(maxsize=256)
 def sector_normalization(name: str) -> Sector | None:
-    """Normalizes sector names to standard Sector enum values."""
-    key = name.strip().lower()
-    if key in SECTOR_SYNONYMS:
-        return Sector(SECTOR_SYNONYMS[key])
-    try:
-        # also convert to title case
-        norm_key = key.replace("_", " ").lower().title()
-        return Sector(norm_key)
-    except ValueError:
-        return None
+    """Normalizes sector names to standard Sector enum values.
+
+    Cached since ETF configs repeat the same handful of sector labels.
+    """
+    key = name.strip().casefold()
+    return SECTOR_SYNONYMS.get(key) or _CANONICAL.get(key.replace("_", " "))
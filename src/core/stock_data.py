@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import date
+from functools import cached_property
 
 import polars as pl
 
@@ -8,6 +9,12 @@ from src.app.logic.data_loader import DashboardData
 
 @dataclass
 class StockData:
+    """Price, fundamental and metadata slice of a single ticker.
+
+    Treated as immutable: filter_date_range returns a new instance, so the
+    cached properties below never need invalidation.
+    """
+
     ticker: str
     prices: pl.DataFrame
     fundamentals: pl.DataFrame
@@ -35,6 +42,35 @@ class StockData:
             metadata=metadata_dict,
         )
 
+    @classmethod
+    def from_dataset_bulk(cls, data: DashboardData) -> dict[str, "StockData"]:
+        """
+        Build StockData for every ticker in the dataset with one partition pass
+        per table, instead of one full filter scan per ticker
+        """
+        prices_by_ticker = data.prices.sort("date").partition_by(
+            "ticker", as_dict=True, maintain_order=True
+        )
+        fundamentals_by_ticker = data.fundamentals.sort("date").partition_by(
+            "ticker", as_dict=True, maintain_order=True
+        )
+        metadata_by_ticker = {row["ticker"]: row for row in data.metadata.iter_rows(named=True)}
+
+        tickers = {key[0] for key in prices_by_ticker} | {key[0] for key in fundamentals_by_ticker}
+        tickers |= metadata_by_ticker.keys()
+        empty_prices = data.prices.clear()
+        empty_fundamentals = data.fundamentals.clear()
+
+        return {
+            ticker: cls(
+                ticker=ticker,
+                prices=prices_by_ticker.get((ticker,), empty_prices),
+                fundamentals=fundamentals_by_ticker.get((ticker,), empty_fundamentals),
+                metadata=metadata_by_ticker.get(ticker, {}),
+            )
+            for ticker in tickers
+        }
+
     def filter_date_range(self, start_date: date, end_date: date) -> "StockData":
         """
         Filter prices and fundamentals to a specific date range
@@ -50,19 +86,21 @@ class StockData:
             metadata=self.metadata,
         )
 
-    @property
+    @cached_property
     def is_empty(self) -> bool:
         """
         Check if there is no price data available
         """
         return self.prices.is_empty()
 
-    @property
+    @cached_property
     def latest_price(self) -> float | None:
         """
         Get the latest closing price
         """
         if self.prices.is_empty():
             return None
-        latest_record = self.prices.sort("date").select("close").row(-1)
-        return float(latest_record[0])
+        # O(n) argmax instead of a full sort; StockData can also be built
+        # directly from frames that were never sorted by date
+        latest_close = self.prices.select(pl.col("close").get(pl.col("date").arg_max())).item()
+        return float(latest_close)
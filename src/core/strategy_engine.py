@@ -1,11 +1,89 @@
+from collections.abc import Callable
+from functools import cache, lru_cache
 from pathlib import Path
 
+import numpy as np
 import polars as pl
 import yaml
 from loguru import logger
 
 from src.core.strategy_models import StrategyFactors
 
+try:
+    # libyaml-backed loader, same safe semantics as yaml.safe_load
+    from yaml import CSafeLoader as _FactorsLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _FactorsLoader  # type: ignore[assignment]
+
+FACTOR_KEYS = ("tech", "stab", "real", "price")
+
+# Row labels and schema of the exposure breakdown, built once at import
+EXPOSURE_LABELS = {
+    "tech": "Technology / Innovation",
+    "stab": "Stability / Defensive",
+    "real": "Real Assets / Industry",
+    "price": "Pricing Power / Brand",
+    "unclassified": "Unclassified",
+}
+_EXPOSURE_SCHEMA = pl.Schema(
+    {"key": pl.Utf8, "factor": pl.Utf8, "value": pl.Float64, "proportion": pl.Float64}
+)
+
+
+def _factor_lookup(profiles: dict[str, StrategyFactors]) -> tuple[pl.Series, dict[str, pl.Series]]:
+    """Lookup table of normalized factors: the keys plus one value series per factor.
+
+    Filled column-wise from one contiguous (n, 4) array instead of per-row dicts.
+    """
+    weights = np.array(
+        [[f.tech, f.stab, f.real, f.price] for f in profiles.values()], dtype=np.float64
+    ).reshape(-1, len(FACTOR_KEYS))
+    keys = pl.Series(list(profiles), dtype=pl.Utf8)
+    return keys, {factor: pl.Series(weights[:, i]) for i, factor in enumerate(FACTOR_KEYS)}
+
+
+def _profile_resolver(
+    overrides: dict[str, StrategyFactors], defaults: dict[str, StrategyFactors]
+) -> Callable[[str, str], StrategyFactors]:
+    """Memoized (ticker, sector) -> profile lookup over one config snapshot.
+
+    A free function instead of lru_cache on the method, which would keep every
+    engine instance alive through the cache.
+    """
+
+    @cache
+    def resolve(ticker: str, sector: str) -> StrategyFactors:
+        if ticker in overrides:
+            return overrides[ticker]
+        if sector in defaults:
+            return defaults[sector]
+        return StrategyFactors()
+
+    return resolve
+
+
+@lru_cache(maxsize=8)
+def _parse_factors_yaml(
+    path: str, mtime: float
+) -> tuple[dict[str, StrategyFactors], dict[str, StrategyFactors]]:
+    """Parse the factor config into (defaults, overrides).
+
+    Keyed on the file's mtime, so every page rerun that creates a new engine
+    reuses the parse until the file changes. The factors are frozen, so the
+    cached instances can be shared between engines.
+    """
+    with open(path) as f:
+        config = yaml.load(f, Loader=_FactorsLoader)
+
+    defaults = {
+        sector: StrategyFactors(**factors) for sector, factors in config.get("defaults", {}).items()
+    }
+    overrides = {
+        ticker: StrategyFactors(**factors)
+        for ticker, factors in config.get("overrides", {}).items()
+    }
+    return defaults, overrides
+
 
 class StrategyEngine:
     def __init__(self, config_path: Path = Path("config/factors.yaml")) -> None:
@@ -15,19 +93,23 @@ class StrategyEngine:
         self._load_config()
 
     def _load_config(self) -> None:
+        self._read_config()
+        # Derived lookups are rebuilt on every (re)load so they never go stale;
+        # the tables turn per-row profile lookups into column expressions
+        self._override_lookup = _factor_lookup(self.overrides)
+        self._default_lookup = _factor_lookup(self.defaults)
+        self._resolve_profile = _profile_resolver(self.overrides, self.defaults)
+
+    def _read_config(self) -> None:
         if not self.config_path.exists():
             logger.warning(f"Strategy factors config not found at {self.config_path}")
             return
 
-        with open(self.config_path) as f:
-            config = yaml.safe_load(f)
-
-        raw_defaults = config.get("defaults", {})
-        for sector, factors in raw_defaults.items():
-            self.defaults[sector] = StrategyFactors(**factors)
-        raw_overrides = config.get("overrides", {})
-        for ticker, factors in raw_overrides.items():
-            self.overrides[ticker] = StrategyFactors(**factors)
+        mtime = self.config_path.stat().st_mtime
+        defaults, overrides = _parse_factors_yaml(str(self.config_path), mtime)
+        # Copy, so the cached dicts stay untouched by this instance
+        self.defaults.update(defaults)
+        self.overrides.update(overrides)
 
     @property
     def factor_mapping(self) -> dict[str, str]:
@@ -53,11 +135,7 @@ class StrategyEngine:
         return StrategyFactors()
 
     def get_factor_profile(self, ticker: str, sector: str) -> StrategyFactors:
-        if ticker in self.overrides:
-            return self.overrides[ticker]
-        if sector in self.defaults:
-            return self.defaults[sector]
-        return StrategyFactors()
+        return self._resolve_profile(ticker, sector)
 
     def join_factor_profiles(
         self,
@@ -66,38 +144,66 @@ class StrategyEngine:
         include_zero: bool = False,
         include_sector_reference: bool = False,
     ) -> pl.DataFrame:
-        relevant_profiles = []
-        relevant_sector_references = []
-
         if df_positions.is_empty():
             return df_positions
+        return df_positions.with_columns(
+            self.resolve_factors_expr(
+                sector_column,
+                include_zero=include_zero,
+                include_sector_reference=include_sector_reference,
+                has_sector=sector_column in df_positions.columns,
+            )
+        )
 
-        for row in df_positions.to_dicts():
-            ticker = row["ticker"]
-            sector = row.get(sector_column, "")
-            profile = self.get_factor_profile(ticker, sector)
-            profile_dict = profile.to_dict(include_zero=include_zero)
-            profile_dict["ticker"] = ticker
-            relevant_profiles.append(profile_dict)
-        if include_sector_reference:
-            for row in df_positions.to_dicts():
-                sector = row.get(sector_column, "")
-                sector_ref = self.get_sector_reference(sector)
-                sector_ref_dict = sector_ref.to_dict(include_zero=include_zero)
-                sector_ref_dict["ticker"] = row["ticker"]
-                relevant_sector_references.append(sector_ref_dict)
-            df_sector_refs = pl.DataFrame(relevant_sector_references)
-            df_profiles = pl.DataFrame(relevant_profiles)
-            df_result = df_positions.join(df_profiles, on="ticker", how="left").join(
-                df_sector_refs, on="ticker", how="left", suffix="_ref"
+    def resolve_factors_expr(
+        self,
+        sector_column: str = "sector",
+        include_zero: bool = False,
+        include_sector_reference: bool = False,
+        has_sector: bool = True,
+    ) -> list[pl.Expr]:
+        """Factor profile columns as plain expressions over "ticker" and the sector.
+
+        Ticker overrides win over sector defaults, unknown assets get zero. Without
+        include_zero, factors of 0.001 or less become null. Being expressions
+        rather than joins, they can be dropped into any larger lazy plan.
+
+        Args:
+            sector_column: Column holding the sector of each position
+            include_zero: Keep zero factors instead of nulling them
+            include_sector_reference: Also add the sector defaults as "{factor}_ref"
+            has_sector: Set to False when the frame has no sector column, which
+                then behaves like an unknown sector
+        """
+        ticker = pl.col("ticker").cast(pl.Utf8)
+        sector = (pl.col(sector_column) if has_sector else pl.lit(None)).cast(pl.Utf8)
+
+        def lookup(
+            source: pl.Expr, table: tuple[pl.Series, dict[str, pl.Series]], factor: str
+        ) -> pl.Expr:
+            keys, values = table
+            return source.replace_strict(
+                keys, values[factor], default=None, return_dtype=pl.Float64
             )
-            return df_result
 
-        df_profiles = pl.DataFrame(relevant_profiles)
-        if df_profiles.is_empty():
-            return df_positions
-        df_result = df_positions.join(df_profiles, on="ticker", how="left")
-        return df_result
+        def factor_value(*sources: pl.Expr) -> pl.Expr:
+            value = pl.coalesce(*sources, pl.lit(0.0))
+            if include_zero:
+                return value
+            return pl.when(value > 0.001).then(value)
+
+        exprs = [
+            factor_value(
+                lookup(ticker, self._override_lookup, f), lookup(sector, self._default_lookup, f)
+            ).alias(f)
+            for f in FACTOR_KEYS
+        ]
+        if include_sector_reference:
+            exprs += [
+                factor_value(lookup(sector, self._default_lookup, f)).alias(f"{f}_ref")
+                for f in FACTOR_KEYS
+            ]
+        return exprs
 
     def calculate_portfolio_exposure(
         self,
@@ -105,41 +211,37 @@ class StrategyEngine:
         value_column: str = "market_value",
         sector_column: str = "sector",
     ) -> pl.DataFrame:
-        df_joined = self.join_factor_profiles(df_positions, sector_column=sector_column)
-        value_sums = (
-            df_joined.with_columns(
-                (pl.col("tech").fill_null(0) * pl.col(value_column)).alias("tech_value"),
-                (pl.col("stab").fill_null(0) * pl.col(value_column)).alias("stab_value"),
-                (pl.col("real").fill_null(0) * pl.col(value_column)).alias("real_value"),
-                (pl.col("price").fill_null(0) * pl.col(value_column)).alias("price_value"),
+        # One query plan: profile lookups and all factor sums in a single pass
+        totals = (
+            df_positions.lazy()
+            .with_columns(
+                self.resolve_factors_expr(
+                    sector_column, has_sector=sector_column in df_positions.columns
+                )
             )
-            .select([value_column, "tech_value", "stab_value", "real_value", "price_value"])
-            .sum()
-        )
-
-        total_portfolio_value = value_sums.select(pl.col(value_column)).item()
-        total_tech = value_sums.select(pl.col("tech_value")).item()
-        total_stab = value_sums.select(pl.col("stab_value")).item()
-        total_real = value_sums.select(pl.col("real_value")).item()
-        total_price = value_sums.select(pl.col("price_value")).item()
-        total_unclassified = total_portfolio_value - (
-            total_tech + total_stab + total_real + total_price
+            .select(
+                pl.col(value_column).sum().alias("total"),
+                *[pl.col(f).fill_null(0).dot(pl.col(value_column)).alias(f) for f in FACTOR_KEYS],
+            )
+            .collect()
+            .row(0, named=True)
         )
 
-        results = [
-            {"key": "tech", "factor": "Technology / Innovation", "value": total_tech},
-            {"key": "stab", "factor": "Stability / Defensive", "value": total_stab},
-            {"key": "real", "factor": "Real Assets / Industry", "value": total_real},
-            {"key": "price", "factor": "Pricing Power / Brand", "value": total_price},
-            {
-                "key": "unclassified",
-                "factor": "Unclassified",
-                "value": total_unclassified,
-            },
-        ]
-        df_result = (
-            pl.DataFrame(results)
-            .with_columns((pl.col("value") / total_portfolio_value).alias("proportion"))
-            .sort("value", descending=True)
+        total_portfolio_value = totals.pop("total")
+        totals["unclassified"] = total_portfolio_value - sum(totals.values())
+
+        # Five rows: sort and divide in Python, then build the frame once
+        rows = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        return pl.DataFrame(
+            [
+                (
+                    key,
+                    EXPOSURE_LABELS[key],
+                    value,
+                    value / total_portfolio_value if total_portfolio_value else float("nan"),
+                )
+                for key, value in rows
+            ],
+            schema=_EXPOSURE_SCHEMA,
+            orient="row",
         )
-        return df_result
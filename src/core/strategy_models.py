@@ -1,42 +1,37 @@
+from dataclasses import dataclass
 from math import isclose
-from typing import Any
 
-from pydantic import BaseModel, Field, model_validator
 
+@dataclass(slots=True, frozen=True)
+class StrategyFactors:
+    """Holds factor definitions for strategy engine.
 
-class StrategyFactors(BaseModel):
-    """Holds factor definitions for strategy engine."""
+    A slotted dataclass rather than a Pydantic model: profiles are resolved per
+    position, and normalization only needs to run once per instance.
+    """
 
-    tech: float = Field(default=0, ge=0, description="Innovation, Growth, R&D")
-    stab: float = Field(default=0, ge=0, description="Stability, Low Vol, Recurring Revenue")
-    real: float = Field(default=0, ge=0, description="Real Assets, Industry, Cyclical")
-    price: float = Field(default=0, ge=0, description="Pricing Power, Brand, Moat")
+    tech: float = 0.0  # Innovation, Growth, R&D
+    stab: float = 0.0  # Stability, Low Vol, Recurring Revenue
+    real: float = 0.0  # Real Assets, Industry, Cyclical
+    price: float = 0.0  # Pricing Power, Brand, Moat
 
-    @model_validator(mode="before")
-    @classmethod
-    def set_defaults(cls, data: Any) -> Any:
-        """Ensure all factors are present, defaulting to 0."""
-        if isinstance(data, dict):
-            return data
-        return data
-
-    @model_validator(mode="after")
-    def normalize_self(self) -> "StrategyFactors":
-        total = self.tech + self.stab + self.real + self.price
-        if isclose(total, 0):
-            return self
-        # in-place normalization
-        self.tech /= total
-        self.stab /= total
-        self.real /= total
-        self.price /= total
-        return self
+    def __post_init__(self) -> None:
+        values = [float(self.tech), float(self.stab), float(self.real), float(self.price)]
+        if any(value < 0 for value in values):
+            raise ValueError(f"Strategy factors must be non-negative, got {values}")
+        total = sum(values)
+        if not isclose(total, 0):
+            values = [value / total for value in values]
+        # Frozen instance, so normalization has to bypass __setattr__
+        for name, value in zip(("tech", "stab", "real", "price"), values, strict=True):
+            object.__setattr__(self, name, value)
 
     def to_dict(self, include_zero: bool = False) -> dict[str, float]:
         """Convert factors to dictionary."""
+        factors = {"tech": self.tech, "stab": self.stab, "real": self.real, "price": self.price}
         if include_zero:
-            return self.model_dump()
-        return {k: v for k, v in self.model_dump().items() if v > 0.001}
+            return factors
+        return {k: v for k, v in factors.items() if v > 0.001}
 
     def __add__(self, other: "StrategyFactors") -> "StrategyFactors":
         return StrategyFactors(
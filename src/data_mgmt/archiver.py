@@ -6,53 +6,119 @@ Provides compressed monolithic snapshots of parquet data for:
 - Data versioning and reproducibility
 """
 
+import fnmatch
+import hashlib
+import heapq
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
+from typing import Any, TypeVar
 
 import polars as pl
+import polars.selectors as cs
 from loguru import logger
 
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
 
-def cast_nulls_to_float(df_raw: pl.DataFrame, string_cols: list[str] | None = None) -> pl.DataFrame:
-    if string_cols is None:
-        string_cols = []
-    string_set = set(string_cols)
-    null_cols = [
-        name
-        for name, dtype in zip(df_raw.columns, df_raw.dtypes, strict=False)
-        if dtype == pl.Null and name not in string_set
-    ]
-    if null_cols:
-        logger.debug(f"Casting null columns to Float64: {null_cols}")
-        df_raw = df_raw.with_columns([pl.col(col).cast(pl.Float64) for col in null_cols])
-    return df_raw
+_MAX_WRITE_WORKERS = 32
+
+
+def cast_nulls_to_float(df_raw: FrameT, string_cols: list[str] | None = None) -> FrameT:
+    # A dtype selector is resolved inside the query plan, so lazy scans need
+    # no schema lookup here and the cast becomes part of the scan itself
+    return df_raw.with_columns(cs.by_dtype(pl.Null).exclude(string_cols or []).cast(pl.Float64))
+
+
+def _snapshot_fingerprint(source_dir: Path, files: list[Path], settings: list[Any]) -> str:
+    """Short hash over (relative path, mtime, size) of every source file plus the settings."""
+    stats = []
+    for file in files:
+        st = file.stat()
+        stats.append((str(file.relative_to(source_dir)), st.st_mtime_ns, st.st_size))
+    payload = json.dumps([sorted(stats), settings])
+    return hashlib.blake2b(payload.encode()).hexdigest()[:16]
+
+
+def _fsync_file(path: Path) -> None:
+    """Flush a file written by the Polars engine to disk before it gets renamed."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist the renames in a directory; a no-op where directories can't be opened."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:  # Windows
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 class DataArchiver:
     """Manages creation and restoration of compressed data snapshots."""
 
-    def __init__(self, base_dir: Path, archive_dir: Path) -> None:
+    def __init__(
+        self,
+        base_dir: Path,
+        archive_dir: Path,
+        compression_level: int = 3,
+        snapshot_row_group_size: int = 500_000,
+        restore_row_group_size: int = 128_000,
+    ) -> None:
         """Initialize archiver with data and archive directories.
 
         Args:
             base_dir: Root directory containing prices/ and fundamentals/
             archive_dir: Directory for storing snapshot archives
+            compression_level: zstd level for snapshots and restored files; raise
+                it for long-term archives, lower it for fast turnarounds
+            snapshot_row_group_size: Rows per row group of a monolithic snapshot
+            restore_row_group_size: Rows per row group of a restored ticker file,
+                matching what ParquetStorage writes for the same files
         """
         self.base_dir = Path(base_dir)
         self.archive_dir = Path(archive_dir)
+        self.compression_level = compression_level
+        self.snapshot_row_group_size = snapshot_row_group_size
+        self.restore_row_group_size = restore_row_group_size
         self.archive_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"DataArchiver initialized (archive: {self.archive_dir})")
 
-    def create_snapshot(self, data_type: str) -> Path:
+    def create_snapshot(
+        self,
+        data_type: str,
+        columns: list[str] | None = None,
+        compression_level: int | None = None,
+        row_group_size: int | None = None,
+    ) -> Path:
         """Create compressed monolithic snapshot of all parquet files.
 
         Optimization: Casts low-cardinality columns to Categorical to reduce memory.
 
         Args:
             data_type: Type of data ("prices" or "fundamentals")
+            columns: Optional subset of columns to snapshot; the column chunks
+                of all other columns are never read from disk
+            compression_level: zstd level, defaults to the archiver's level; low
+                levels write much faster for a slightly larger file
+            row_group_size: Rows per parquet row group, defaults to the archiver's
+                snapshot size; smaller groups speed up filtered reads of the
+                snapshot, larger ones suit pure backups
 
         Returns:
-            Path to created snapshot file
+            Path to created snapshot file, or to the newest existing snapshot if
+            neither the source files nor the settings changed since it was written
 
         Raises:
             ValueError: If data_type is invalid or no data found
@@ -76,6 +142,25 @@ class DataArchiver:
         if not files:
             raise ValueError(f"No parquet files found in {source_dir} using pattern {file_pattern}")
 
+        if compression_level is None:
+            compression_level = self.compression_level
+        if row_group_size is None:
+            row_group_size = self.snapshot_row_group_size
+
+        safe_name = str(data_type).replace("/", "_").replace("\\", "_").lower()
+
+        # Stat-only fingerprint of the sources and write settings; when it matches
+        # the newest snapshot, nothing changed and no data needs to be read
+        fingerprint = _snapshot_fingerprint(
+            source_dir, files, [columns, compression_level, row_group_size]
+        )
+        previous = self.list_snapshots(safe_name, limit=1)
+        if previous:
+            fp_path = previous[0].with_name(f"{previous[0].name}.fp")
+            if fp_path.exists() and fp_path.read_text(encoding="utf-8") == fingerprint:
+                logger.info(f"No changes, reusing snapshot {previous[0]}")
+                return previous[0]
+
         logger.info(f"Creating {data_type} snapshot from {len(files)} files in {source_dir}")
 
         # Optimize memory: Cast low-cardinality columns to Categorical
@@ -88,37 +173,60 @@ class DataArchiver:
             "industry",
             "country",
         ]
-        if data_type == "fundamentals":
-            categorical_cols.append("period_type")
+        # Build one lazy plan over all files and stream it to disk, so memory
+        # stays bounded by a batch instead of the whole dataset. One scan per
+        # file rather than a single glob scan: files written at different
+        # times can differ in columns and dtypes, which diagonal_relaxed unifies
         try:
-            file_paths = [str(file) for file in files]
-            dfs = [
-                cast_nulls_to_float(pl.read_parquet(fp), string_cols=categorical_cols)
-                for fp in file_paths
-            ]
-            data = pl.concat(dfs, how="diagonal_relaxed")
+            lf = pl.concat(
+                [
+                    cast_nulls_to_float(pl.scan_parquet(file), string_cols=categorical_cols)
+                    for file in files
+                ],
+                how="diagonal_relaxed",
+                # The engine reads and decodes the scans concurrently on its
+                # own thread pool, no Python-side executor needed
+                parallel=True,
+            )
+            if columns:
+                lf = lf.select(columns)
+            schema = lf.collect_schema()
+            # Answered from the parquet footers, no data pages are read
+            row_count = lf.select(pl.len()).collect().item()
         except Exception as e:
             logger.error(f"Failed to read parquet files: {e}")
             raise
 
-        if data.is_empty():
+        if row_count == 0:
             raise ValueError(f"No data found in {source_dir}")
 
-        for col in categorical_cols:
-            if col in data.columns:
-                data = data.with_columns(pl.col(col).cast(pl.Categorical))
+        # All casts in one with_columns; each name must appear only once there
+        lf = lf.with_columns(
+            [pl.col(col).cast(pl.Categorical) for col in categorical_cols if col in schema]
+        )
 
         # Generate snapshot filename with current date
-        safe_name = str(data_type).replace("/", "_").replace("\\", "_").lower()
         snapshot_date = date.today().isoformat()
         snapshot_filename = f"{safe_name}_snapshot_{snapshot_date}.parquet"
         snapshot_path = self.archive_dir / snapshot_filename
 
-        # Write with compression
-        data.write_parquet(snapshot_path, compression="zstd")
+        # Drop a stale sidecar first, so a failed write can never be reused
+        fp_path = snapshot_path.with_name(f"{snapshot_filename}.fp")
+        fp_path.unlink(missing_ok=True)
+
+        # Write with compression; row group statistics let readers of the
+        # snapshot skip groups when filtering
+        lf.sink_parquet(
+            snapshot_path,
+            compression="zstd",
+            compression_level=compression_level,
+            row_group_size=row_group_size,
+            statistics=True,
+        )
+        snapshot_path.with_name(f"{snapshot_filename}.fp").write_text(fingerprint, encoding="utf-8")
 
         logger.success(
-            f"Created snapshot: {snapshot_path} ({len(data):,} rows, "
+            f"Created snapshot: {snapshot_path} ({row_count:,} rows, "
             f"{snapshot_path.stat().st_size / 1024 / 1024:.2f} MB)"
         )
 
@@ -140,48 +248,165 @@ class DataArchiver:
 
         logger.info(f"Restoring snapshot from {snapshot_path}")
 
-        # Read snapshot
-        snapshot_data = pl.read_parquet(snapshot_path)
+        # Validate against the parquet footer before loading any data
+        lf = pl.scan_parquet(snapshot_path)
+        if "ticker" not in lf.collect_schema():
+            raise ValueError("Snapshot missing 'ticker' column")
 
-        if snapshot_data.is_empty():
+        # Answered from the parquet footer, no data pages are read
+        if lf.select(pl.len()).collect().item() == 0:
             raise ValueError("Snapshot contains no data")
 
-        if "ticker" not in snapshot_data.columns:
-            raise ValueError("Snapshot missing 'ticker' column")
-
         # Ensure target directory exists
         target_dir = Path(target_dir)
         target_dir.mkdir(parents=True, exist_ok=True)
 
-        # Get unique tickers
-        tickers = snapshot_data.select("ticker").unique().to_series().to_list()
-        logger.info(f"Restoring {len(tickers)} tickers to {target_dir}")
+        # Partitioned sinks only exist in newer Polars releases
+        if hasattr(pl, "PartitionBy"):
+            restored = self._restore_streaming(lf, target_dir)
+        else:
+            restored = self._restore_in_memory(lf, target_dir)
 
-        # Iterate and write individual files
-        for ticker in tickers:
-            ticker_df = snapshot_data.filter(pl.col("ticker") == ticker)
-            ticker_path = target_dir / f"{ticker}.parquet"
+        logger.success(f"Restored {restored} ticker files to {target_dir}")
 
-            ticker_df.write_parquet(ticker_path, compression="zstd")
+    def _restore_streaming(self, lf: pl.LazyFrame, target_dir: Path) -> int:
+        """Stream the snapshot into one file per ticker without materializing it."""
+        tickers: list[str] = []
+
+        def ticker_file(args: Any) -> str:
+            ticker = args.partition_keys["ticker"][0]
+            tickers.append(ticker)
+            return f"{ticker}.parquet.tmp"
+
+        try:
+            lf.sink_parquet(
+                pl.PartitionBy(
+                    target_dir,
+                    key="ticker",
+                    include_key=True,
+                    file_path_provider=ticker_file,
+                    # One file per ticker, never split by size
+                    approximate_bytes_per_file=None,
+                ),
+                compression="zstd",
+                compression_level=self.compression_level,
+                row_group_size=self.restore_row_group_size,
+                statistics=True,
+            )
+            # Only a completed sink replaces the existing ticker files
+            for ticker in tickers:
+                tmp_path = target_dir / f"{ticker}.parquet.tmp"
+                _fsync_file(tmp_path)
+                os.replace(tmp_path, target_dir / f"{ticker}.parquet")
+        except Exception:
+            for ticker in tickers:
+                (target_dir / f"{ticker}.parquet.tmp").unlink(missing_ok=True)
+            raise
+        _fsync_dir(target_dir)
+        return len(tickers)
+
+    def _restore_in_memory(self, lf: pl.LazyFrame, target_dir: Path) -> int:
+        """Load the snapshot, split it by ticker and write the files concurrently."""
+        # The streaming engine decodes the file in batches, so peak memory is
+        # the materialized frame rather than the frame plus a full decode buffer
+        snapshot_data = lf.collect(engine="streaming")
+
+        # Split into per-ticker frames in a single pass; each ticker goes to its
+        # own file, so group order is irrelevant (rows keep their order within
+        # a group either way)
+        partitions = snapshot_data.partition_by(
+            "ticker", as_dict=True, include_key=True, maintain_order=False
+        )
+        logger.info(f"Restoring {len(partitions)} tickers to {target_dir}")
+
+        def write_ticker(ticker: str, ticker_df: pl.DataFrame) -> None:
+            # Same temp file + rename as ParquetStorage.atomic_write, so a failed
+            # restore never leaves a torn ticker file behind
+            ticker_path = target_dir / f"{ticker}.parquet"
+            tmp_path = target_dir / f"{ticker}.parquet.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    ticker_df.write_parquet(
+                        f,
+                        compression="zstd",
+                        compression_level=self.compression_level,
+                        row_group_size=self.restore_row_group_size,
+                        statistics=True,
+                    )
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, ticker_path)
+            except Exception:
+                tmp_path.unlink(missing_ok=True)
+                raise
             logger.debug(f"Restored {ticker}: {len(ticker_df)} rows -> {ticker_path}")
 
-        logger.success(f"Restored {len(tickers)} ticker files to {target_dir}")
+        # Polars releases the GIL while compressing and writing, so the
+        # per-ticker files can be written concurrently; zstd is CPU-bound,
+        # so more threads than cores (the executor default) only adds contention.
+        # Past _MAX_WRITE_WORKERS the disk, not compression, is the bottleneck
+        max_workers = max(1, min(len(partitions), os.cpu_count() or 1, _MAX_WRITE_WORKERS))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(write_ticker, ticker, df) for (ticker,), df in partitions.items()
+            ]
+            for future in futures:
+                # Surface write errors just like the sequential loop did
+                future.result()
+
+        _fsync_dir(target_dir)
+        return len(partitions)
 
-    def list_snapshots(self, data_type: str | None = None) -> list[Path]:
+    def _scan_snapshots(
+        self, data_type: str | None, limit: int | None = None
+    ) -> list[os.DirEntry[str]]:
+        """Matching archive entries from one scandir pass, newest first."""
+        if data_type:
+            pattern = f"{data_type}_snapshot_*.parquet"
+        else:
+            pattern = "*_snapshot_*.parquet"
+
+        # One scandir pass matched on the bare names: no Path objects or stat
+        # calls for unrelated entries. Names embed the ISO date, so a reverse
+        # name sort puts the newest first
+        matches = re.compile(fnmatch.translate(pattern)).match
+        with os.scandir(self.archive_dir) as it:
+            entries = [entry for entry in it if matches(entry.name)]
+        if limit is not None:
+            # nlargest with a small limit is a linear scan instead of a full sort
+            entries = heapq.nlargest(limit, entries, key=lambda entry: entry.name)
+        else:
+            entries.sort(key=lambda entry: entry.name, reverse=True)
+        logger.debug(f"Found {len(entries)} snapshots matching '{pattern}'")
+        return entries
+
+    def list_snapshots(
+        self, data_type: str | None = None, *, limit: int | None = None
+    ) -> list[Path]:
         """List available snapshots in archive directory.
 
         Args:
             data_type: Filter by data type ("prices" or "fundamentals"), or None for all
+            limit: Return at most this many of the newest snapshots, all if None
 
         Returns:
             List of snapshot file paths, sorted by date (newest first)
         """
-        if data_type:
-            pattern = f"{data_type}_snapshot_*.parquet"
-        else:
-            pattern = "*_snapshot_*.parquet"
+        return [Path(entry.path) for entry in self._scan_snapshots(data_type, limit)]
+
+    def list_snapshot_sizes(self, data_type: str | None = None) -> list[tuple[str, int]]:
+        """List available snapshots together with their file size.
 
-        snapshots = sorted(self.archive_dir.glob(pattern), reverse=True)
-        logger.debug(f"Found {len(snapshots)} snapshots matching '{pattern}'")
+        Sizes come from the directory entries of the listing pass, which cache
+        their stat result, so callers need no extra stat per snapshot.
 
-        return snapshots
+        Args:
+            data_type: Filter by data type ("prices" or "fundamentals"), or None for all
+
+        Returns:
+            (file name, size in bytes) per snapshot, sorted by date (newest first)
+        """
+        return [
+            (entry.name, entry.stat(follow_symlinks=False).st_size)
+            for entry in self._scan_snapshots(data_type)
+        ]
@@ -112,6 +112,68 @@ class DataExtractor:
             logger.error(f"[{ticker}] Failed to fetch prices: {e}")
             raise
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        reraise=True,
+    )  # type: ignore[misc]
+    def get_prices_batch(self, start_dates: dict[str, date]) -> dict[str, pd.DataFrame]:
+        """
+        Fetch historical price data for several tickers in one download.
+
+        yfinance batches multi-ticker downloads, so N tickers cost one request
+        instead of N. Everything is fetched from the earliest start date and
+        each ticker's frame is then cut back to its own start date.
+
+        Args:
+            start_dates: Start date (inclusive) per ticker symbol
+
+        Returns:
+            pandas DataFrame per ticker in the same layout as get_prices; tickers
+            without any rows in the download are left out, so callers can fall
+            back to get_prices for them
+
+        Raises:
+            Exception: Network or yfinance errors after 3 retry attempts
+        """
+        if not start_dates:
+            return {}
+        start = min(start_dates.values())
+        logger.info(f"Fetching prices for {len(start_dates)} tickers from {start}")
+
+        try:
+            price_data = yf.download(
+                list(start_dates),
+                start=start,
+                group_by="ticker",
+                progress=False,
+                auto_adjust=True,
+                actions=True,
+            )
+        except Exception as e:
+            logger.error(f"Failed to fetch batch prices: {e}")
+            raise
+
+        batch: dict[str, pd.DataFrame] = {}
+        if price_data.empty:
+            return batch
+        available = set(price_data.columns.get_level_values(0))
+        for ticker, ticker_start in start_dates.items():
+            if ticker not in available:
+                continue
+            # Rows of the shared date index where this ticker had no quotes are all
+            # NaN; both cuts go into one mask so the frame is copied only once
+            ticker_data = price_data[ticker]
+            keep = ticker_data.notna().any(axis=1) & (
+                ticker_data.index >= pd.Timestamp(ticker_start)
+            )
+            ticker_data = ticker_data[keep]
+            if not ticker_data.empty:
+                batch[ticker] = ticker_data
+
+        logger.success(f"Fetched prices for {len(batch)}/{len(start_dates)} tickers")
+        return batch
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -164,9 +226,14 @@ class DataExtractor:
                 raise ValueError(msg)
 
             # Merge vertically (rows are metrics, columns are dates)
-            # Remove duplicate metrics (e.g., Net Income appears in multiple statements)
-            combined = pd.concat([inc, bal, cash])
-            combined = combined[~combined.index.duplicated(keep="first")]
+            # Keep the first occurrence of duplicate metrics (e.g., Net Income
+            # appears in multiple statements) while collecting the rows, so the
+            # frame is built once instead of concatenated and then filtered
+            rows: dict[str, pd.Series] = {}
+            for statement in (inc, bal, cash):
+                for metric, values in statement.iterrows():
+                    rows.setdefault(metric, values)
+            combined = pd.DataFrame.from_dict(rows, orient="index")
 
             logger.success(f"[{ticker}] Fetched {len(combined)} fundamental metrics")
             return combined
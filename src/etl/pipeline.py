@@ -4,13 +4,15 @@ Coordinates extraction, transformation, and loading of stock market data.
 Implements incremental load logic for prices and full refresh for fundamentals.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, timedelta
 
+import pandas as pd
 import polars as pl
 from loguru import logger
 from tqdm import tqdm
 
-from src.core.domain_models import ReportType
+from src.core.domain_models import FINANCIAL_REPORT_SCHEMA, ReportType
 from src.core.file_manager import ParquetStorage
 from src.core.mapper import (
     map_fundamentals_to_domain,
@@ -25,24 +27,36 @@ class ETLPipeline:
 
     # Hard constraint for initial price data fetch
     INITIAL_START_DATE = date(2021, 1, 1)
+    # Concurrent per-ticker updates; bounded to stay below Yahoo's rate limits
+    MAX_WORKERS = 16
     CURRENCY_OVERRIDE = {
         "WSRI.PA": "EUR",
     }
 
     def get_currency(self, ticker: str, metadata: pl.DataFrame | None) -> str:
-        """Determine the currency for a given ticker."""
+        """Determine the currency for a given ticker.
+
+        Currencies practically never change, so each ticker is resolved once per
+        pipeline; the fundamentals update asks twice per ticker (annual and
+        quarterly), and a metadata miss would otherwise hit yfinance every time.
+        """
         if ticker in self.CURRENCY_OVERRIDE:
             return self.CURRENCY_OVERRIDE[ticker]
+        if ticker in self._currency_cache:
+            return self._currency_cache[ticker]
 
+        currency: str | None = None
         if (metadata is not None) and (not metadata.is_empty()):
             # return currency from provided metadata
             currency_row = metadata.filter(pl.col("ticker") == ticker).select("currency")
             if not currency_row.is_empty():
-                currency_value: str = currency_row.item()
-                return currency_value
+                currency = currency_row.item()
+
+        if currency is None:
+            currency_dict = self.extractor.get_ticker_info(ticker)
+            currency = currency_dict.get("currency", "USD")
 
-        currency_dict = self.extractor.get_ticker_info(ticker)
-        currency: str = currency_dict.get("currency", "USD")
+        self._currency_cache[ticker] = currency
         return currency
 
     def __init__(self, storage: ParquetStorage, extractor: DataExtractor) -> None:
@@ -55,6 +69,7 @@ class ETLPipeline:
         """
         self.storage = storage
         self.extractor = extractor
+        self._currency_cache: dict[str, str] = {}
         logger.info("ETLPipeline initialized")
 
     def run_metadata_update(self, tickers: list[str]) -> None:
@@ -131,39 +146,76 @@ class ETLPipeline:
         """
         logger.info(f"Starting price update for {len(tickers)} tickers")
 
-        for ticker in tqdm(tickers):
-            try:
-                # Gap Detection: Check if we already have data for this ticker
-                filename = f"prices_{ticker}"
-                start_date = self._detect_price_gap(filename)
-                if start_date > date.today():
-                    logger.info(f"[{ticker}] No new data to fetch (up-to-date)")
-                    continue
+        # Gap Detection: Check which tickers need new data and from when
+        start_dates: dict[str, date] = {}
+        existing: dict[str, pl.LazyFrame | None] = {}
+        for ticker in tickers:
+            existing_lf, start_date = self._load_existing(f"prices_{ticker}")
+            if start_date > date.today():
+                logger.info(f"[{ticker}] No new data to fetch (up-to-date)")
+                continue
+            start_dates[ticker] = start_date
+            existing[ticker] = existing_lf
+
+        # One batched download for all pending tickers; anything missing from it
+        # is fetched on its own below
+        try:
+            batch = self.extractor.get_prices_batch(start_dates)
+        except Exception as e:
+            logger.warning(f"Batch price download failed, fetching per ticker: {e}")
+            batch = {}
+
+        # Per-ticker work is network and parquet I/O, both release the GIL
+        with ThreadPoolExecutor(max_workers=self._worker_count(len(start_dates))) as pool:
+            futures = [
+                pool.submit(
+                    self._update_prices,
+                    ticker,
+                    start_date,
+                    existing[ticker],
+                    batch.get(ticker),
+                    metadata,
+                )
+                for ticker, start_date in start_dates.items()
+            ]
+            for future in tqdm(as_completed(futures), total=len(futures)):
+                future.result()
+
+    def _update_prices(
+        self,
+        ticker: str,
+        start_date: date,
+        existing_lf: pl.LazyFrame | None,
+        raw_pdf: pd.DataFrame | None,
+        metadata: pl.DataFrame | None,
+    ) -> None:
+        """Fetch (unless already downloaded), merge and write the prices of one ticker."""
+        try:
+            filename = f"prices_{ticker}"
 
-                # Fetch new data from yfinance
+            # Fetch new data from yfinance
+            if raw_pdf is None:
                 raw_pdf = self.extractor.get_prices(ticker, start_date)
-                currency = self.get_currency(ticker, metadata)
+            currency = self.get_currency(ticker, metadata)
 
-                # Transform to domain model
-                new_df = map_prices_to_df(raw_pdf, ticker, currency)
+            # Transform to domain model
+            new_df = map_prices_to_df(raw_pdf, ticker, currency)
 
-                # Merge with existing data if available
-                merged_df = self._merge_price_data(filename, new_df)
+            # Merge with existing data if available
+            merged_df = self._merge_price_data(filename, existing_lf, new_df)
 
-                # Atomic write back to storage
-                self.storage.atomic_write(merged_df, filename)
+            # Atomic write back to storage
+            self.storage.atomic_write(merged_df, filename)
 
-                logger.success(f"[{ticker}] Price update complete ({len(merged_df)} total rows)")
+            logger.success(f"[{ticker}] Price update complete ({len(merged_df)} total rows)")
 
-            except ValueError as e:
-                # No data found - log warning but continue with other tickers
-                logger.warning(f"[{ticker}] Skipped: {e}")
-                continue
+        except ValueError as e:
+            # No data found - log warning but continue with other tickers
+            logger.warning(f"[{ticker}] Skipped: {e}")
 
-            except Exception as e:
-                # Unexpected error - log but don't crash entire pipeline
-                logger.error(f"[{ticker}] Price update failed: {e}")
-                continue
+        except Exception as e:
+            # Unexpected error - log but don't crash entire pipeline
+            logger.error(f"[{ticker}] Price update failed: {e}")
 
     def run_fundamental_update(
         self, tickers: list[str], metadata: pl.DataFrame | None = None
@@ -180,110 +232,130 @@ class ETLPipeline:
         """
         logger.info(f"Starting fundamental update for {len(tickers)} tickers")
 
-        for ticker in tqdm(tickers):
-            for report_type in [ReportType.ANNUAL, ReportType.QUARTERLY]:
-                try:
-                    # Fetch complete financial statements from yfinance
-                    raw_pdf = self.extractor.get_financials(ticker, report_type=report_type)
-                    currency = self.get_currency(ticker, metadata)
-
-                    # Transform to domain model (list of FinancialReport objects)
-                    reports = map_fundamentals_to_domain(raw_pdf, ticker, report_type, currency)
-
-                    if not reports:
-                        logger.warning(f"[{ticker}] Mapping produced no reports")
-                        continue
-
-                    # Convert to Polars DataFrame for storage
-                    records = [report.model_dump() for report in reports]
-                    fundamentals_df = pl.DataFrame(records)
-
-                    # Atomic overwrite of existing data
-                    filename = f"{report_type.value.lower()}/fundamentals_{ticker}"
-                    self.storage.atomic_update(
-                        fundamentals_df,
-                        filename,
-                        unique_keys=["ticker", "report_date", "period_type"],
-                    )
-
-                    logger.success(
-                        f"[{ticker}] Fundamental update complete ({len(reports)} reports)"
-                    )
-
-                except ValueError as e:
-                    # No data found - log warning but continue with other tickers
-                    logger.warning(f"[{ticker}] Skipped: {e}")
-                    continue
+        with ThreadPoolExecutor(max_workers=self._worker_count(len(tickers))) as pool:
+            futures = [
+                pool.submit(self._update_fundamentals, ticker, metadata) for ticker in tickers
+            ]
+            for future in tqdm(as_completed(futures), total=len(futures)):
+                future.result()
 
-                except Exception as e:
-                    # Unexpected error - log but don't crash entire pipeline
-                    logger.error(f"[{ticker}] Fundamental update failed: {e}")
+    def _update_fundamentals(self, ticker: str, metadata: pl.DataFrame | None) -> None:
+        """Refresh the annual and quarterly fundamentals of one ticker."""
+        for report_type in [ReportType.ANNUAL, ReportType.QUARTERLY]:
+            try:
+                # Fetch complete financial statements from yfinance
+                raw_pdf = self.extractor.get_financials(ticker, report_type=report_type)
+                currency = self.get_currency(ticker, metadata)
+
+                # Transform to domain model (list of FinancialReport objects)
+                reports = map_fundamentals_to_domain(raw_pdf, ticker, report_type, currency)
+
+                if not reports:
+                    logger.warning(f"[{ticker}] Mapping produced no reports")
                     continue
 
-    def _detect_price_gap(self, filename: str) -> date:
+                # Convert to Polars DataFrame for storage; reports are flat, so the
+                # raw field values equal model_dump() without the export overhead,
+                # and the declared schema skips type inference over all rows
+                records = [report.__dict__ for report in reports]
+                fundamentals_df = pl.from_dicts(records, schema=FINANCIAL_REPORT_SCHEMA)
+
+                # Atomic overwrite of existing data
+                filename = f"{report_type.value.lower()}/fundamentals_{ticker}"
+                self.storage.atomic_update(
+                    fundamentals_df,
+                    filename,
+                    unique_keys=["ticker", "report_date", "period_type"],
+                )
+
+                logger.success(f"[{ticker}] Fundamental update complete ({len(reports)} reports)")
+
+            except ValueError as e:
+                # No data found - log warning but continue with other tickers
+                logger.warning(f"[{ticker}] Skipped: {e}")
+                continue
+
+            except Exception as e:
+                # Unexpected error - log but don't crash entire pipeline
+                logger.error(f"[{ticker}] Fundamental update failed: {e}")
+                continue
+
+    def _worker_count(self, jobs: int) -> int:
+        return max(1, min(jobs, self.MAX_WORKERS))
+
+    def _load_existing(self, filename: str) -> tuple[pl.LazyFrame | None, date]:
         """
-        Determine the start date for incremental price data fetch.
+        Scan stored prices and determine the start date for the incremental fetch.
+
+        Only max(date) is computed here, which the parquet scan answers from the
+        row group statistics; the scan is handed on to the merge, so the history
+        is decoded once, and only for tickers that actually get new data.
 
         Logic:
-        - If file exists: Return max(date) + 1 day (fetch only new data)
-        - If file doesn't exist: Return INITIAL_START_DATE (full history)
+        - If file exists: Return a scan of the stored prices and max(date) + 1 day
+        - If file doesn't exist: Return None and INITIAL_START_DATE (full history)
 
         Args:
             filename: Parquet filename (without .parquet extension)
 
         Returns:
-            Date to start fetching from
+            Scan of the stored prices (or None) and the date to start fetching from
         """
         try:
-            existing_df = self.storage.read(filename)
+            existing_lf = self.storage.scan(filename)
 
             # Find the most recent date in existing data
-            max_date_value = existing_df.select(pl.col("date").max()).item()
+            max_date_value = existing_lf.select(pl.col("date").max()).collect().item()
             assert isinstance(max_date_value, date), "Expected date type from max(date)"
 
             # Start from the next day
             start_date = max_date_value + timedelta(days=1)
 
             logger.info(f"[{filename}] Gap detected: fetching from {start_date}")
-            return start_date
+            return existing_lf, start_date
 
         except FileNotFoundError:
             # No existing data - start from hard constraint date
             logger.info(f"[{filename}] New ticker: fetching from {self.INITIAL_START_DATE}")
-            return self.INITIAL_START_DATE
+            return None, self.INITIAL_START_DATE
 
-    def _merge_price_data(self, filename: str, new_df: pl.DataFrame) -> pl.DataFrame:
+    def _merge_price_data(
+        self, filename: str, existing_lf: pl.LazyFrame | None, new_df: pl.DataFrame
+    ) -> pl.DataFrame:
         """
         Merge new price data with existing data, removing duplicates.
 
         Strategy:
-        - If file exists: vstack old + new, deduplicate by date, sort
-        - If file doesn't exist: return new data as-is
+        - If data exists: append only the new rows dated after the stored history
+        - If there is no stored data: return new data as-is
 
         Args:
-            filename: Parquet filename (without .parquet extension)
+            filename: Parquet filename (without .parquet extension), for logging
+            existing_lf: Scan of the stored prices from _load_existing, or None
             new_df: New price data to merge
 
         Returns:
             Merged and deduplicated DataFrame
         """
-        try:
-            existing_df = self.storage.read(filename)
-
-            # Stack old and new data vertically
-            merged = (
-                pl.concat([existing_df, new_df])
-                .unique(subset=["date"], maintain_order=False)
-                .sort("date")
-            )
-
-            logger.debug(
-                f"[{filename}] Merged {len(existing_df)} + {len(new_df)} "
-                f"→ {len(merged)} rows (after dedup)"
-            )
-            return merged
-
-        except FileNotFoundError:
+        if existing_lf is None:
             # No existing data - just return new data
             logger.debug(f"[{filename}] No existing data, using new data as-is")
             return new_df
+        existing_df = existing_lf.collect()
+
+        # Stored history is written sorted by date, so anything up to its last
+        # date is already there; dropping it up front replaces a hash dedup
+        # and a full re-sort with a bitmask filter and a plain append
+        max_date = existing_df.get_column("date").max()
+        if max_date is not None:
+            new_df = new_df.filter(pl.col("date") > max_date)
+        # The fetched frame itself can repeat a date (e.g. yfinance's duplicated
+        # last bar); deduplicating the few new rows is cheap, the latest one wins
+        new_df = new_df.unique("date", keep="last", maintain_order=True).sort("date")
+        merged = existing_df.vstack(new_df).rechunk()
+
+        logger.debug(
+            f"[{filename}] Merged {len(existing_df)} + {len(new_df)} "
+            f"→ {len(merged)} rows (after dedup)"
+        )
+        return merged
@@ -0,0 +1,125 @@
+"""Data quality metrics for fetched financial statements.
+
+Shared by the provider research scripts, so both score statements the same way.
+"""
+
+from typing import Any
+
+import polars as pl
+
+# Pure letter symbols are US listings, everything else carries an exchange suffix
+US_TICKER_PATTERN = r"^[A-Z]+$"
+
+# Critical columns to check for data quality, as named by yfinance's statements
+YFINANCE_BALANCE_SHEET_CRITICAL_COLS = [
+    "total_assets",
+    "total_liabilities_net_minority_interest",
+    "stockholders_equity",
+]
+
+YFINANCE_INCOME_STATEMENT_CRITICAL_COLS = [
+    "total_revenue",
+    "net_income",
+    "ebitda",
+]
+
+# The same checks against OpenBB's normalized statement fields
+OPENBB_BALANCE_SHEET_CRITICAL_COLS = [
+    "total_assets",
+    "total_liabilities",
+    "total_equity",
+]
+
+OPENBB_INCOME_STATEMENT_CRITICAL_COLS = [
+    "revenue",
+    "net_income",
+    "ebitda",
+]
+
+
+def _lower(cols: list[str]) -> frozenset[str]:
+    return frozenset(col.lower() for col in cols)
+
+
+# Lower-cased lookups for calculate_quality_score, built once at import
+YFINANCE_BALANCE_SHEET_CRITICAL_LOWER = _lower(YFINANCE_BALANCE_SHEET_CRITICAL_COLS)
+YFINANCE_INCOME_STATEMENT_CRITICAL_LOWER = _lower(YFINANCE_INCOME_STATEMENT_CRITICAL_COLS)
+OPENBB_BALANCE_SHEET_CRITICAL_LOWER = _lower(OPENBB_BALANCE_SHEET_CRITICAL_COLS)
+OPENBB_INCOME_STATEMENT_CRITICAL_LOWER = _lower(OPENBB_INCOME_STATEMENT_CRITICAL_COLS)
+
+# Columns of a calculate_quality_score result, in the order it returns them
+QUALITY_METRIC_SCHEMA = {
+    "rows_count": pl.Int64,
+    "critical_cols_found": pl.Int64,
+    "critical_cols_missing": pl.Int64,
+    "null_count": pl.Int64,
+    "data_completeness_pct": pl.Float64,
+}
+
+
+def calculate_quality_score(
+    df: pl.DataFrame | None, critical_cols_lower: frozenset[str]
+) -> dict[str, Any]:
+    """Calculate data quality metrics for a financial statement DataFrame.
+
+    Metrics include row count, critical column coverage, and null value counts.
+    critical_cols_lower holds the lower-cased critical column names; callers
+    build it once per statement type rather than per call.
+    """
+    if df is None or df.height == 0:
+        return {
+            "rows_count": 0,
+            "critical_cols_found": 0,
+            "critical_cols_missing": len(critical_cols_lower),
+            "null_count": 0,
+            "data_completeness_pct": 0.0,
+        }
+
+    # Normalize column names to lowercase for comparison, once per column
+    lower_by_orig = {col: col.lower() for col in df.columns}
+    df_cols_lower = set(lower_by_orig.values())
+
+    # Check which critical columns are present
+    cols_found = critical_cols_lower & df_cols_lower
+    cols_missing = critical_cols_lower - df_cols_lower
+
+    # Count nulls in critical columns that exist, all columns in one select
+    found_cols = [col for col, lower in lower_by_orig.items() if lower in cols_found]
+    null_count = sum(df.select(pl.col(found_cols).null_count()).row(0)) if found_cols else 0
+    total_cells = df.height * len(found_cols)
+
+    # Calculate data completeness percentage
+    completeness = ((total_cells - null_count) / total_cells * 100) if total_cells > 0 else 0.0
+
+    return {
+        "rows_count": df.height,
+        "critical_cols_found": len(cols_found),
+        "critical_cols_missing": len(cols_missing),
+        "null_count": null_count,
+        "data_completeness_pct": round(completeness, 2),
+    }
+
+
+class QualityResults:
+    """Table of calculate_quality_score results, one row per scored statement.
+
+    Rows are led by the given string key columns (e.g. ticker, provider) and the
+    statement type. Values are collected per column and the frame is built once
+    with a fixed schema, so no types are inferred.
+    """
+
+    def __init__(self, *key_columns: str) -> None:
+        self.schema = {
+            **dict.fromkeys(key_columns, pl.Utf8),
+            "statement_type": pl.Utf8,
+            **QUALITY_METRIC_SCHEMA,
+        }
+        self._columns: dict[str, list[Any]] = {name: [] for name in self.schema}
+
+    def add(self, score: dict[str, Any], statement_type: str, **keys: str) -> None:
+        """Append one calculate_quality_score result under the given key values."""
+        for name, value in {**keys, "statement_type": statement_type, **score}.items():
+            self._columns[name].append(value)
+
+    def to_frame(self) -> pl.DataFrame:
+        return pl.DataFrame(self._columns, schema=self.schema)
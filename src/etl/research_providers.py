@@ -4,12 +4,34 @@ This script evaluates yfinance data coverage and quality metrics
 to validate it as a reliable data source.
 """
 
+import argparse
+import hashlib
+import json
+import os
+import time
 import warnings
-from datetime import datetime
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache, wraps
+from pathlib import Path
 from typing import Any, cast
 
+import numpy as np
+import pandas as pd
 import polars as pl
 import yfinance as yf
+from yfinance.data import YfData
+
+from src.etl.quality import (
+    US_TICKER_PATTERN,
+    YFINANCE_BALANCE_SHEET_CRITICAL_COLS,
+    YFINANCE_BALANCE_SHEET_CRITICAL_LOWER,
+    YFINANCE_INCOME_STATEMENT_CRITICAL_COLS,
+    YFINANCE_INCOME_STATEMENT_CRITICAL_LOWER,
+    QualityResults,
+    calculate_quality_score,
+)
 
 # Test universe: mix of US and international stocks
 TEST_TICKERS = [
@@ -34,18 +56,101 @@ TEST_TICKERS = [
     "8001.T",  # Japan: Itochu Corporation
 ]
 
-# Critical columns to check for data quality
-BALANCE_SHEET_CRITICAL_COLS = [
-    "total_assets",
-    "total_liabilities_net_minority_interest",
-    "stockholders_equity",
-]
+# Quote columns kept per ticker by run_data_analysis
+PRICE_RESULT_SCHEMA = {
+    "ticker": pl.Utf8,
+    "company_name": pl.Utf8,
+    "price": pl.Float64,
+    "currency": pl.Utf8,
+    "exchange": pl.Utf8,
+}
+
+# Yahoo's quote endpoint takes up to this many comma-separated symbols per request
+QUOTE_BATCH_SIZE = 20
+QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+
+# Responses are cached on disk so repeated research runs skip the network;
+# statements change at most quarterly, quotes go stale quickly.
+# None disables the cache (--no-cache)
+CACHE_DIR: Path | None = Path(".yf_cache")
+STATEMENT_CACHE_TTL = 24 * 60 * 60
+QUOTE_CACHE_TTL = 15 * 60
+
+# Concurrent tickers in flight; enough to hide Yahoo's latency without
+# tripping its rate limit
+MAX_WORKERS = 8
+
+
+@lru_cache(maxsize=256)
+def _ticker(ticker: str) -> yf.Ticker:
+    """One yf.Ticker per symbol, shared by the info and statement fetchers.
+
+    The object keeps its scraper state between the fetches, so the info,
+    balance sheet and income statement lookups of a symbol reuse it.
+    """
+    return yf.Ticker(ticker)
 
-INCOME_STATEMENT_CRITICAL_COLS = [
-    "total_revenue",
-    "net_income",
-    "ebitda",
-]
+
+def _cache_file(kind: str, ticker: str, suffix: str) -> Path | None:
+    """Path of the cache file for (kind, ticker), or None if caching is off."""
+    if CACHE_DIR is None:
+        return None
+    return CACHE_DIR / kind / f"{ticker}{suffix}"
+
+
+def _is_fresh(path: Path, ttl: float) -> bool:
+    """Whether the cache file exists and is younger than ttl seconds."""
+    return path.exists() and time.time() - path.stat().st_mtime < ttl
+
+
+def _write_cache_file(path: Path, write: Callable[[Path], object]) -> None:
+    """Write a cache entry via temp file and rename, so readers never see a torn file."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        warnings.warn(f"Failed to write cache file {path}: {str(e)}", stacklevel=2)
+
+
+def _load_quote(ticker: str) -> dict[str, Any] | None:
+    path = _cache_file("quotes", ticker, ".json")
+    if path is None or not _is_fresh(path, QUOTE_CACHE_TTL):
+        return None
+    return cast(dict[str, Any], json.loads(path.read_text(encoding="utf-8")))
+
+
+def _store_quote(ticker: str, quote: dict[str, Any]) -> None:
+    path = _cache_file("quotes", ticker, ".json")
+    if path is not None:
+        _write_cache_file(path, lambda p: p.write_text(json.dumps(quote), encoding="utf-8"))
+
+
+def _statement_cached(
+    kind: str,
+) -> Callable[[Callable[[str], pl.DataFrame | None]], Callable[[str], pl.DataFrame | None]]:
+    """Serve a statement fetcher from the parquet disk cache while fresh.
+
+    Failed fetches (None) are not cached, so they are retried on the next run.
+    """
+
+    def decorator(
+        fetch: Callable[[str], pl.DataFrame | None],
+    ) -> Callable[[str], pl.DataFrame | None]:
+        @wraps(fetch)
+        def cached_fetch(ticker: str) -> pl.DataFrame | None:
+            path = _cache_file(kind, ticker, ".parquet")
+            if path is not None and _is_fresh(path, STATEMENT_CACHE_TTL):
+                return pl.read_parquet(path)
+            df = fetch(ticker)
+            if path is not None and df is not None:
+                _write_cache_file(path, df.write_parquet)
+            return df
+
+        return cached_fetch
+
+    return decorator
 
 
 def fetch_stock_info(ticker: str) -> dict[str, Any] | None:
@@ -53,8 +158,11 @@ def fetch_stock_info(ticker: str) -> dict[str, Any] | None:
 
     Returns dict with price, currency, and exchange info or None if fetch fails.
     """
+    cached = _load_quote(ticker)
+    if cached is not None:
+        return cached
     try:
-        stock = yf.Ticker(ticker)
+        stock = _ticker(ticker)
         info = stock.info
 
         # Get current price (try multiple fields as they vary)
@@ -62,32 +170,84 @@ def fetch_stock_info(ticker: str) -> dict[str, Any] | None:
             info.get("currentPrice") or info.get("regularMarketPrice") or info.get("previousClose")
         )
 
-        return {
+        stock_info = {
             "price": price,
             "currency": info.get("currency", "USD"),
             "exchange": info.get("exchange", "N/A"),
             "company_name": info.get("shortName", ticker),
         }
+        _store_quote(ticker, stock_info)
+        return stock_info
     except Exception as e:
         warnings.warn(f"Failed to fetch info for {ticker}: {str(e)}", stacklevel=2)
         return None
 
 
+def fetch_all_quotes(tickers: list[str]) -> dict[str, dict[str, Any]]:
+    """Fetch price, currency, exchange and name of many tickers in batched requests.
+
+    One request per QUOTE_BATCH_SIZE symbols instead of one .info call per
+    ticker; yfinance's shared session supplies the cookie and crumb Yahoo
+    requires. Returns the same fields as fetch_stock_info keyed by symbol;
+    symbols missing from the response or in a failed batch are left out.
+    Fresh quotes from the disk cache are not requested again.
+    """
+    quotes: dict[str, dict[str, Any]] = {}
+    for ticker in tickers:
+        cached = _load_quote(ticker)
+        if cached is not None:
+            quotes[ticker] = cached
+    missing = [ticker for ticker in tickers if ticker not in quotes]
+
+    for i in range(0, len(missing), QUOTE_BATCH_SIZE):
+        batch = missing[i : i + QUOTE_BATCH_SIZE]
+        try:
+            response = YfData().get_raw_json(
+                QUOTE_URL, params={"symbols": ",".join(batch), "formatted": "false"}
+            )
+        except Exception as e:
+            warnings.warn(f"Failed to fetch quotes for {', '.join(batch)}: {str(e)}", stacklevel=2)
+            continue
+
+        for quote in response.get("quoteResponse", {}).get("result", []):
+            symbol = quote.get("symbol")
+            quotes[symbol] = {
+                "price": quote.get("regularMarketPrice") or quote.get("regularMarketPreviousClose"),
+                "currency": quote.get("currency", "USD"),
+                "exchange": quote.get("exchange", "N/A"),
+                "company_name": quote.get("shortName", symbol),
+            }
+            _store_quote(symbol, quotes[symbol])
+    return quotes
+
+
+def _statement_to_polars(df_pandas: pd.DataFrame) -> pl.DataFrame:
+    """Turn a yfinance statement (metrics as rows, dates as columns) into dates as rows.
+
+    Each metric row of the values array becomes one float column directly, so
+    there is no pandas transpose, reset_index or from_pandas copy in between.
+    Missing values stay null, as they would through from_pandas.
+    """
+    values = df_pandas.to_numpy(dtype=np.float64, na_value=np.nan)
+    metrics = [str(metric).lower().replace(" ", "_") for metric in df_pandas.index]
+    return pl.DataFrame(
+        [pl.Series("date", df_pandas.columns.to_numpy())]
+        + [pl.Series(metric, values[i], nan_to_null=True) for i, metric in enumerate(metrics)]
+    )
+
+
+@_statement_cached("balance_sheet")
 def fetch_balance_sheet(ticker: str) -> pl.DataFrame | None:
     """Fetch balance sheet data using yfinance.
 
     Returns Polars DataFrame or None if fetch fails.
     """
     try:
-        stock = yf.Ticker(ticker)
+        stock = _ticker(ticker)
         df_pandas = stock.balance_sheet
 
         if df_pandas is not None and not df_pandas.empty:
-            # Convert column names to lowercase snake_case
-            df_pandas.index = df_pandas.index.str.lower().str.replace(" ", "_")
-            # Transpose so dates are rows
-            df_pandas = df_pandas.T
-            return pl.from_pandas(df_pandas.reset_index())
+            return _statement_to_polars(df_pandas)
 
         return None
     except Exception as e:
@@ -95,21 +255,18 @@ def fetch_balance_sheet(ticker: str) -> pl.DataFrame | None:
         return None
 
 
+@_statement_cached("income_statement")
 def fetch_income_statement(ticker: str) -> pl.DataFrame | None:
     """Fetch income statement data using yfinance.
 
     Returns Polars DataFrame or None if fetch fails.
     """
     try:
-        stock = yf.Ticker(ticker)
+        stock = _ticker(ticker)
         df_pandas = stock.income_stmt
 
         if df_pandas is not None and not df_pandas.empty:
-            # Convert column names to lowercase snake_case
-            df_pandas.index = df_pandas.index.str.lower().str.replace(" ", "_")
-            # Transpose so dates are rows
-            df_pandas = df_pandas.T
-            return pl.from_pandas(df_pandas.reset_index())
+            return _statement_to_polars(df_pandas)
 
         return None
     except Exception as e:
@@ -117,126 +274,111 @@ def fetch_income_statement(ticker: str) -> pl.DataFrame | None:
         return None
 
 
-def calculate_quality_score(df: pl.DataFrame | None, critical_columns: list[str]) -> dict[str, Any]:
-    """Calculate data quality metrics for a financial statement DataFrame.
+def fetch_ticker_data(
+    ticker: str, quote: dict[str, Any] | None = None
+) -> tuple[dict[str, Any] | None, pl.DataFrame | None, pl.DataFrame | None]:
+    """Fetch stock info, balance sheet and income statement of one ticker.
 
-    Metrics include row count, critical column coverage, and null value counts.
+    An already fetched batch quote is used as stock info; only without one
+    the ticker's .info is requested.
     """
-    if df is None or df.height == 0:
-        return {
-            "rows_count": 0,
-            "critical_cols_found": 0,
-            "critical_cols_missing": len(critical_columns),
-            "null_count": 0,
-            "data_completeness_pct": 0.0,
-        }
-
-    # Normalize column names to lowercase for comparison
-    df_cols_lower = {col.lower() for col in df.columns}
-    critical_cols_lower = {col.lower() for col in critical_columns}
-
-    # Check which critical columns are present
-    cols_found = critical_cols_lower & df_cols_lower
-    cols_missing = critical_cols_lower - df_cols_lower
-
-    # Count nulls in critical columns that exist
-    null_count = 0
-    total_cells = 0
-
-    for col in df.columns:
-        if col.lower() in cols_found:
-            null_count += df[col].null_count()
-            total_cells += df.height
-
-    # Calculate data completeness percentage
-    completeness = ((total_cells - null_count) / total_cells * 100) if total_cells > 0 else 0.0
-
-    return {
-        "rows_count": df.height,
-        "critical_cols_found": len(cols_found),
-        "critical_cols_missing": len(cols_missing),
-        "null_count": null_count,
-        "data_completeness_pct": round(completeness, 2),
-    }
+    stock_info = quote or fetch_stock_info(ticker)
+    return stock_info, fetch_balance_sheet(ticker), fetch_income_statement(ticker)
 
 
-def run_data_analysis() -> tuple[pl.DataFrame, pl.DataFrame]:
+def run_data_analysis(force: bool = False) -> tuple[pl.DataFrame, pl.DataFrame]:
     """Execute data quality analysis across all tickers.
 
+    The result tables are cached per ticker set and day, so refreshing the
+    report on the same day returns them without fetching or scoring again;
+    force recomputes them.
+
     Returns tuple of (quality_results_df, price_results_df).
     """
-    quality_results = []
-    price_results = []
+    # Key on the ticker set and the day: a new day or universe is a new analysis
+    key = hashlib.blake2b(
+        f"{','.join(sorted(TEST_TICKERS))}|{date.today().isoformat()}".encode()
+    ).hexdigest()[:16]
+    quality_path = _cache_file("results", key, "_quality.parquet")
+    price_path = _cache_file("results", key, "_prices.parquet")
+    if (
+        not force
+        and quality_path is not None
+        and price_path is not None
+        and quality_path.exists()
+        and price_path.exists()
+    ):
+        print(f"Using cached results {key} (--force to recompute)")
+        return pl.read_parquet(quality_path), pl.read_parquet(price_path)
+
+    quality = QualityResults("ticker")
+    # Quotes are collected per column as well, the frame is built after the loop
+    price_cols: dict[str, list[Any]] = {name: [] for name in PRICE_RESULT_SCHEMA}
+
+    # Prices of all tickers in one batched request
+    quotes = fetch_all_quotes(TEST_TICKERS)
+
+    # The fetches are blocking HTTP round-trips, so fetch the tickers
+    # concurrently and only report sequentially; map keeps the ticker order
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(TEST_TICKERS))) as pool:
+        fetched = list(
+            pool.map(fetch_ticker_data, TEST_TICKERS, [quotes.get(t) for t in TEST_TICKERS])
+        )
 
-    for ticker in TEST_TICKERS:
-        print(f"\n{'='*60}")
-        print(f"Processing: {ticker}")
-        print(f"{'='*60}")
+    for ticker, (stock_info, bs_df, is_df) in zip(TEST_TICKERS, fetched, strict=True):
+        # Report lines of this ticker, written in one go at the end
+        lines = [f"\n{'='*60}", f"Processing: {ticker}", f"{'='*60}"]
 
-        # Fetch current stock price and info
-        stock_info = fetch_stock_info(ticker)
+        # Current stock price and info
         if stock_info:
-            price_results.append(
-                {
-                    "ticker": ticker,
-                    "company_name": stock_info["company_name"],
-                    "price": stock_info["price"],
-                    "currency": stock_info["currency"],
-                    "exchange": stock_info["exchange"],
-                }
-            )
-            print(f"  Company: {stock_info['company_name']}")
-            print(f"  Price: {stock_info['price']} {stock_info['currency']}")
+            price_cols["ticker"].append(ticker)
+            for name in ("company_name", "price", "currency", "exchange"):
+                price_cols[name].append(stock_info[name])
+            lines.append(f"  Company: {stock_info['company_name']}")
+            lines.append(f"  Price: {stock_info['price']} {stock_info['currency']}")
         else:
-            print("  Price: N/A")
-
-        # Fetch Balance Sheet
-        print("\n  Fetching Balance Sheet...")
-        bs_df = fetch_balance_sheet(ticker)
-        bs_quality = calculate_quality_score(bs_df, BALANCE_SHEET_CRITICAL_COLS)
-
-        quality_results.append(
-            {
-                "ticker": ticker,
-                "statement_type": "balance_sheet",
-                **bs_quality,
-            }
-        )
+            lines.append("  Price: N/A")
+
+        # Balance Sheet
+        lines.append("\n  Balance Sheet...")
+        bs_quality = calculate_quality_score(bs_df, YFINANCE_BALANCE_SHEET_CRITICAL_LOWER)
 
-        print(f"    ✓ {bs_quality['rows_count']} periods found")
-        print(
-            f"    ✓ {bs_quality['critical_cols_found']}/{len(BALANCE_SHEET_CRITICAL_COLS)} "
-            f"critical columns present"
+        quality.add(bs_quality, "balance_sheet", ticker=ticker)
+
+        lines.append(f"    ✓ {bs_quality['rows_count']} periods found")
+        lines.append(
+            f"    ✓ {bs_quality['critical_cols_found']}/"
+            f"{len(YFINANCE_BALANCE_SHEET_CRITICAL_COLS)} critical columns present"
         )
-        print(f"    ✓ {bs_quality['data_completeness_pct']}% data completeness")
+        lines.append(f"    ✓ {bs_quality['data_completeness_pct']}% data completeness")
 
         if bs_quality["critical_cols_missing"] > 0:
-            print(f"    ⚠ {bs_quality['critical_cols_missing']} critical columns missing")
-
-        # Fetch Income Statement
-        print("\n  Fetching Income Statement...")
-        is_df = fetch_income_statement(ticker)
-        is_quality = calculate_quality_score(is_df, INCOME_STATEMENT_CRITICAL_COLS)
-
-        quality_results.append(
-            {
-                "ticker": ticker,
-                "statement_type": "income_statement",
-                **is_quality,
-            }
-        )
+            lines.append(f"    ⚠ {bs_quality['critical_cols_missing']} critical columns missing")
+
+        # Income Statement
+        lines.append("\n  Income Statement...")
+        is_quality = calculate_quality_score(is_df, YFINANCE_INCOME_STATEMENT_CRITICAL_LOWER)
+
+        quality.add(is_quality, "income_statement", ticker=ticker)
 
-        print(f"    ✓ {is_quality['rows_count']} periods found")
-        print(
-            f"    ✓ {is_quality['critical_cols_found']}/{len(INCOME_STATEMENT_CRITICAL_COLS)} "
-            f"critical columns present"
+        lines.append(f"    ✓ {is_quality['rows_count']} periods found")
+        lines.append(
+            f"    ✓ {is_quality['critical_cols_found']}/"
+            f"{len(YFINANCE_INCOME_STATEMENT_CRITICAL_COLS)} critical columns present"
         )
-        print(f"    ✓ {is_quality['data_completeness_pct']}% data completeness")
+        lines.append(f"    ✓ {is_quality['data_completeness_pct']}% data completeness")
 
         if is_quality["critical_cols_missing"] > 0:
-            print(f"    ⚠ {is_quality['critical_cols_missing']} critical columns missing")
+            lines.append(f"    ⚠ {is_quality['critical_cols_missing']} critical columns missing")
 
-    return pl.DataFrame(quality_results), pl.DataFrame(price_results)
+        print("\n".join(lines))
+
+    quality_results = quality.to_frame()
+    price_results = pl.DataFrame(price_cols, schema=PRICE_RESULT_SCHEMA)
+    if quality_path is not None and price_path is not None:
+        _write_cache_file(quality_path, quality_results.write_parquet)
+        _write_cache_file(price_path, price_results.write_parquet)
+    return quality_results, price_results
 
 
 def generate_summary_report(results_df: pl.DataFrame, price_df: pl.DataFrame) -> None:
@@ -250,8 +392,10 @@ def generate_summary_report(results_df: pl.DataFrame, price_df: pl.DataFrame) ->
         print("\n💰 CURRENT STOCK PRICES:")
         print(price_df)
 
-    # Overall summary
-    overall_summary = results_df.select(
+    # All report tables as lazy queries over the same frame, collected together
+    # so Polars runs them in parallel instead of one eager pass after another
+    results_lf = results_df.lazy()
+    overall_lf = results_lf.select(
         [
             pl.col("rows_count").sum().alias("total_periods"),
             pl.col("rows_count").mean().alias("avg_periods_per_statement"),
@@ -260,14 +404,8 @@ def generate_summary_report(results_df: pl.DataFrame, price_df: pl.DataFrame) ->
             pl.col("null_count").sum().alias("total_nulls"),
         ]
     )
-
-    print("\n📊 OVERALL DATA QUALITY:")
-    print(overall_summary)
-
-    # Detailed breakdown by ticker
-    print("\n\n📋 BREAKDOWN BY TICKER:")
-    detailed = (
-        results_df.group_by("ticker")
+    detailed_lf = (
+        results_lf.group_by("ticker")
         .agg(
             [
                 pl.col("rows_count").sum().alias("total_periods"),
@@ -277,17 +415,38 @@ def generate_summary_report(results_df: pl.DataFrame, price_df: pl.DataFrame) ->
         )
         .sort("ticker")
     )
-    print(detailed)
-
-    # Statement type performance
-    print("\n\n📈 PERFORMANCE BY STATEMENT TYPE:")
-    statement_perf = results_df.group_by("statement_type").agg(
+    statement_perf_lf = results_lf.group_by("statement_type").agg(
         [
             pl.col("rows_count").mean().alias("avg_periods"),
             pl.col("data_completeness_pct").mean().alias("avg_completeness"),
             pl.col("critical_cols_missing").mean().alias("avg_missing_cols"),
         ]
     )
+    # International vs US split; the ticker pattern is matched once into a
+    # mask column that both sides reuse
+    completeness = pl.col("data_completeness_pct")
+    is_us = pl.col("is_us")
+    market_lf = results_lf.with_columns(
+        pl.col("ticker").str.contains(US_TICKER_PATTERN).alias("is_us")
+    ).select(
+        (~is_us).sum().alias("intl_count"),  # Exclude pure US tickers
+        is_us.sum().alias("us_count"),  # Only pure US tickers
+        completeness.filter(~is_us).mean().alias("intl_completeness"),
+        completeness.filter(is_us).mean().alias("us_completeness"),
+    )
+    overall_summary, detailed, statement_perf, market = pl.collect_all(
+        [overall_lf, detailed_lf, statement_perf_lf, market_lf]
+    )
+
+    print("\n📊 OVERALL DATA QUALITY:")
+    print(overall_summary)
+
+    # Detailed breakdown by ticker
+    print("\n\n📋 BREAKDOWN BY TICKER:")
+    print(detailed)
+
+    # Statement type performance
+    print("\n\n📈 PERFORMANCE BY STATEMENT TYPE:")
     print(statement_perf)
 
     # Quality assessment
@@ -309,16 +468,9 @@ def generate_summary_report(results_df: pl.DataFrame, price_df: pl.DataFrame) ->
         print("\n❌ yfinance data quality is LOW - consider alternative sources")
 
     # International coverage analysis
-    international_stocks = results_df.filter(
-        ~pl.col("ticker").str.contains("^[A-Z]+$")  # Exclude pure US tickers
-    )
-    us_stocks = results_df.filter(
-        pl.col("ticker").str.contains("^[A-Z]+$")  # Only pure US tickers
-    )
-
-    if international_stocks.height > 0 and us_stocks.height > 0:
-        intl_mean = international_stocks["data_completeness_pct"].mean()
-        us_mean = us_stocks["data_completeness_pct"].mean()
+    if market["intl_count"][0] > 0 and market["us_count"][0] > 0:
+        intl_mean = market["intl_completeness"][0]
+        us_mean = market["us_completeness"][0]
         intl_avg_complete = cast(float, intl_mean) if intl_mean is not None else 0.0
         us_avg_complete = cast(float, us_mean) if us_mean is not None else 0.0
         print(f"\n🌍 International Coverage: {intl_avg_complete:.1f}% complete")
@@ -327,12 +479,25 @@ def generate_summary_report(results_df: pl.DataFrame, price_df: pl.DataFrame) ->
 
 def main() -> None:
     """Main execution function."""
+    global CACHE_DIR
+
+    parser = argparse.ArgumentParser(description="yfinance data quality analysis")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Ignore and skip the on-disk response cache"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Recompute the results even if cached for today"
+    )
+    args = parser.parse_args()
+    if args.no_cache:
+        CACHE_DIR = None
+
     print("🔬 Starting yfinance Data Quality Analysis...")
     print(f"Testing tickers: {', '.join(TEST_TICKERS)}")
     print(f"Analysis date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
     # Run analysis
-    quality_results, price_results = run_data_analysis()
+    quality_results, price_results = run_data_analysis(force=args.force)
 
     # Generate report
     generate_summary_report(quality_results, price_results)
@@ -11,11 +11,22 @@ RECOMMENDATION: Use research_providers.py (yfinance directly) instead.
 """
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
 import polars as pl
 
+from src.etl.quality import (
+    OPENBB_BALANCE_SHEET_CRITICAL_COLS,
+    OPENBB_BALANCE_SHEET_CRITICAL_LOWER,
+    OPENBB_INCOME_STATEMENT_CRITICAL_COLS,
+    OPENBB_INCOME_STATEMENT_CRITICAL_LOWER,
+    US_TICKER_PATTERN,
+    QualityResults,
+    calculate_quality_score,
+)
+
 try:
     from openbb import obb
 
@@ -37,18 +48,11 @@ TEST_TICKERS = [
 # Providers to test (fmp requires API key)
 PROVIDERS = ["yfinance", "fmp"]
 
-# Critical columns to check for data quality
-BALANCE_SHEET_CRITICAL_COLS = [
-    "total_assets",
-    "total_liabilities",
-    "total_equity",
-]
+# Concurrent (ticker, provider) fetches in flight
+MAX_WORKERS = 8
 
-INCOME_STATEMENT_CRITICAL_COLS = [
-    "revenue",
-    "net_income",
-    "ebitda",
-]
+# Quoted price per (ticker, provider) pair
+PRICE_RESULT_SCHEMA = {"ticker": pl.Utf8, "provider": pl.Utf8, "price": pl.Float64}
 
 
 def fetch_stock_quote(ticker: str, provider: str) -> dict[str, Any] | None:
@@ -143,47 +147,15 @@ def fetch_income_statement_openbb(ticker: str, provider: str) -> pl.DataFrame |
         return None
 
 
-def calculate_quality_score(df: pl.DataFrame | None, critical_columns: list[str]) -> dict[str, Any]:
-    """Calculate data quality metrics for a financial statement DataFrame.
-
-    Metrics include row count, critical column coverage, and null value counts.
-    """
-    if df is None or df.height == 0:
-        return {
-            "rows_count": 0,
-            "critical_cols_found": 0,
-            "critical_cols_missing": len(critical_columns),
-            "null_count": 0,
-            "data_completeness_pct": 0.0,
-        }
-
-    # Normalize column names to lowercase for comparison
-    df_cols_lower = {col.lower() for col in df.columns}
-    critical_cols_lower = {col.lower() for col in critical_columns}
-
-    # Check which critical columns are present
-    cols_found = critical_cols_lower & df_cols_lower
-    cols_missing = critical_cols_lower - df_cols_lower
-
-    # Count nulls in critical columns that exist
-    null_count = 0
-    total_cells = 0
-
-    for col in df.columns:
-        if col.lower() in cols_found:
-            null_count += df[col].null_count()
-            total_cells += df.height
-
-    # Calculate data completeness percentage
-    completeness = ((total_cells - null_count) / total_cells * 100) if total_cells > 0 else 0.0
-
-    return {
-        "rows_count": df.height,
-        "critical_cols_found": len(cols_found),
-        "critical_cols_missing": len(cols_missing),
-        "null_count": null_count,
-        "data_completeness_pct": round(completeness, 2),
-    }
+def fetch_provider_data(
+    ticker: str, provider: str
+) -> tuple[dict[str, Any] | None, pl.DataFrame | None, pl.DataFrame | None]:
+    """Fetch quote, balance sheet and income statement of one ticker from one provider."""
+    return (
+        fetch_stock_quote(ticker, provider),
+        fetch_balance_sheet_openbb(ticker, provider),
+        fetch_income_statement_openbb(ticker, provider),
+    )
 
 
 def run_provider_comparison() -> tuple[pl.DataFrame, pl.DataFrame]:
@@ -195,72 +167,67 @@ def run_provider_comparison() -> tuple[pl.DataFrame, pl.DataFrame]:
         print("❌ OpenBB is not available. Cannot run comparison.")
         return pl.DataFrame(), pl.DataFrame()
 
-    quality_results = []
-    price_results = []
+    quality = QualityResults("ticker", "provider")
+    price_cols: dict[str, list[Any]] = {name: [] for name in PRICE_RESULT_SCHEMA}
+
+    # Every (ticker, provider) pair is independent blocking I/O, so fetch the
+    # whole matrix concurrently and only report sequentially
+    pairs = [(ticker, provider) for ticker in TEST_TICKERS for provider in PROVIDERS]
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pairs))) as pool:
+        results = pool.map(
+            fetch_provider_data, [ticker for ticker, _ in pairs], [p for _, p in pairs]
+        )
+        fetched = dict(zip(pairs, results, strict=True))
 
     for ticker in TEST_TICKERS:
-        print(f"\n{'='*60}")
-        print(f"Processing: {ticker}")
-        print(f"{'='*60}")
+        # Report lines of this ticker, written in one go at the end
+        lines = [f"\n{'='*60}", f"Processing: {ticker}", f"{'='*60}"]
 
         for provider in PROVIDERS:
-            print(f"\n  Provider: {provider}")
+            lines.append(f"\n  Provider: {provider}")
+            quote_data, bs_df, is_df = fetched[ticker, provider]
 
-            # Fetch current quote
-            quote_data = fetch_stock_quote(ticker, provider)
+            # Current quote
             if quote_data:
-                price_results.append(
-                    {
-                        "ticker": ticker,
-                        "provider": provider,
-                        "price": quote_data["price"],
-                    }
-                )
-                print(f"    Current Price: {quote_data['price']}")
+                price_cols["ticker"].append(ticker)
+                price_cols["provider"].append(provider)
+                price_cols["price"].append(quote_data["price"])
+                lines.append(f"    Current Price: {quote_data['price']}")
             else:
-                print("    Current Price: N/A")
-
-            # Fetch Balance Sheet
-            print("    Fetching Balance Sheet...")
-            bs_df = fetch_balance_sheet_openbb(ticker, provider)
-            bs_quality = calculate_quality_score(bs_df, BALANCE_SHEET_CRITICAL_COLS)
-
-            quality_results.append(
-                {
-                    "ticker": ticker,
-                    "provider": provider,
-                    "statement_type": "balance_sheet",
-                    **bs_quality,
-                }
-            )
+                lines.append("    Current Price: N/A")
+
+            # Balance Sheet
+            lines.append("    Balance Sheet...")
+            bs_quality = calculate_quality_score(bs_df, OPENBB_BALANCE_SHEET_CRITICAL_LOWER)
 
-            print(
+            quality.add(bs_quality, "balance_sheet", ticker=ticker, provider=provider)
+
+            lines.append(
                 f"      ✓ {bs_quality['rows_count']} periods | "
-                f"{bs_quality['critical_cols_found']}/{len(BALANCE_SHEET_CRITICAL_COLS)} cols | "
+                f"{bs_quality['critical_cols_found']}/"
+                f"{len(OPENBB_BALANCE_SHEET_CRITICAL_COLS)} cols | "
                 f"{bs_quality['data_completeness_pct']}% complete"
             )
 
-            # Fetch Income Statement
-            print("    Fetching Income Statement...")
-            is_df = fetch_income_statement_openbb(ticker, provider)
-            is_quality = calculate_quality_score(is_df, INCOME_STATEMENT_CRITICAL_COLS)
-
-            quality_results.append(
-                {
-                    "ticker": ticker,
-                    "provider": provider,
-                    "statement_type": "income_statement",
-                    **is_quality,
-                }
-            )
+            # Income Statement
+            lines.append("    Income Statement...")
+            is_quality = calculate_quality_score(is_df, OPENBB_INCOME_STATEMENT_CRITICAL_LOWER)
 
-            print(
+            quality.add(is_quality, "income_statement", ticker=ticker, provider=provider)
+
+            lines.append(
                 f"      ✓ {is_quality['rows_count']} periods | "
-                f"{is_quality['critical_cols_found']}/{len(INCOME_STATEMENT_CRITICAL_COLS)} cols | "
+                f"{is_quality['critical_cols_found']}/"
+                f"{len(OPENBB_INCOME_STATEMENT_CRITICAL_COLS)} cols | "
                 f"{is_quality['data_completeness_pct']}% complete"
             )
 
-    return pl.DataFrame(quality_results), pl.DataFrame(price_results)
+        print("\n".join(lines))
+
+    return (
+        quality.to_frame(),
+        pl.DataFrame(price_cols, schema=PRICE_RESULT_SCHEMA),
+    )
 
 
 def generate_summary_report(results_df: pl.DataFrame, price_df: pl.DataFrame) -> None:
@@ -333,8 +300,12 @@ def generate_summary_report(results_df: pl.DataFrame, price_df: pl.DataFrame) ->
     # International vs US coverage by provider
     print("\n\n🌍 INTERNATIONAL vs US COVERAGE:")
 
-    intl_results = results_df.filter(~pl.col("ticker").str.contains("^[A-Z]+$"))
-    us_results = results_df.filter(pl.col("ticker").str.contains("^[A-Z]+$"))
+    # Match the ticker pattern once into a mask column both splits reuse
+    by_market = results_df.with_columns(
+        pl.col("ticker").str.contains(US_TICKER_PATTERN).alias("is_us")
+    )
+    intl_results = by_market.filter(~pl.col("is_us"))
+    us_results = by_market.filter(pl.col("is_us"))
 
     if intl_results.height > 0 and us_results.height > 0:
         coverage_comparison = pl.concat(
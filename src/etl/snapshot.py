@@ -1,22 +1,37 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from loguru import logger
 
 from src.config.settings import load_config
 from src.data_mgmt.archiver import DataArchiver
 
 
-def make_snapshot(data_type: str | None = None) -> None:
-    """Create compressed snapshots of price and fundamental data."""
+def make_snapshot(data_type: str | list[str] | None = None) -> list[str]:
+    """Create compressed snapshots of price and fundamental data.
+
+    Args:
+        data_type: Data type or list of data types to snapshot, all if None
+
+    Returns:
+        The data types whose snapshot failed; every type is attempted
+    """
     logger.info("=== Creating Data Snapshots ===")
 
     # Load configuration
     config = load_config()
 
     # Initialize archiver
-    archiver = DataArchiver(config.settings.base_dir, config.settings.archive_dir)
+    archiver = DataArchiver(
+        config.settings.base_dir,
+        config.settings.archive_dir,
+        compression_level=config.settings.snapshot_compression_level,
+    )
 
     # Create snapshots for all data types
-    if data_type:
+    if isinstance(data_type, str):
         data_types = [data_type]
+    elif data_type:
+        data_types = list(data_type)
     else:
         data_types = [
             "metadata",
@@ -25,9 +40,19 @@ def make_snapshot(data_type: str | None = None) -> None:
             "fundamentals/quarterly",
         ]
 
-    for data_type in data_types:
-        try:
-            snapshot_path = archiver.create_snapshot(data_type)
-            logger.success(f"Created {data_type} snapshot: {snapshot_path}")
-        except Exception as e:
-            logger.error(f"Failed to create {data_type} snapshot: {e}")
+    # Each snapshot is a separate file; reading and compressing run in the
+    # Polars engine without the GIL, so the types can be written concurrently
+    failed = []
+    with ThreadPoolExecutor(max_workers=len(data_types)) as pool:
+        futures = {
+            pool.submit(archiver.create_snapshot, data_type): data_type for data_type in data_types
+        }
+        for future in as_completed(futures):
+            data_type = futures[future]
+            try:
+                snapshot_path = future.result()
+                logger.success(f"Created {data_type} snapshot: {snapshot_path}")
+            except Exception as e:
+                logger.error(f"Failed to create {data_type} snapshot: {e}")
+                failed.append(data_type)
+    return failed
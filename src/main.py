@@ -4,31 +4,74 @@ Supports:
 - etl: Run data extraction and storage pipeline
 - snapshot: Create compressed backup snapshots
 - restore: Restore data from snapshots
+
+Polars, pandas and yfinance are imported inside the commands that need them,
+so ``--help`` and the archive commands don't pay for the whole data stack.
 """
 
+from __future__ import annotations
+
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import polars as pl
 from loguru import logger
 
 from src.config.settings import Config, load_config
-from src.core.domain_models import AssetType
-from src.core.file_manager import ParquetStorage
-from src.data_mgmt.archiver import DataArchiver
-from src.etl.extract import DataExtractor
-from src.etl.pipeline import ETLPipeline
-from src.etl.snapshot import make_snapshot
 
+if TYPE_CHECKING:
+    import polars as pl
+
+    from src.core.file_manager import ParquetStorage
+    from src.data_mgmt.archiver import DataArchiver
+
+# One CLI run is one process, so the config is read and validated once even
+# when commands chain (etl -> load metadata -> fundamentals). Kept local to the
+# CLI: the dashboard must pick up config edits without a restart
+_load_config = lru_cache(maxsize=1)(load_config)
+
+
+@cache
+def _storage(base_path: Path, *subdirectories: str) -> ParquetStorage:
+    """Shared storage per directory, so chained commands don't set it up again."""
+    from src.core.file_manager import ParquetStorage
+
+    return ParquetStorage(base_path, subdirectories=list(subdirectories) or None)
+
+
+@lru_cache(maxsize=1)
+def _archiver() -> DataArchiver:
+    """Archiver for the configured base and archive directories."""
+    from src.data_mgmt.archiver import DataArchiver
+
+    settings = _load_config().settings
+    return DataArchiver(settings.base_dir, settings.archive_dir)
 
-def cmd_load_metadata(args: argparse.Namespace) -> None:
+
+# The ETL steps only filter metadata by ticker and asset type and look up the
+# currency; reading just these columns skips decoding names, sectors etc.
+ETL_METADATA_COLUMNS = ["ticker", "asset_type", "currency"]
+
+# Data types restored by the high-level restore, each into its own subdirectory
+RESTORE_DATA_TYPES = ("prices", "fundamentals", "metadata")
+
+
+def cmd_load_metadata(args: argparse.Namespace) -> pl.DataFrame:
     """Load Metadata from yfinance for given tickers, only loads
     not yet known tickers.
+
+    Returns the asset metadata (ETL_METADATA_COLUMNS only), so callers need not
+    read it again.
     """
+    from src.etl.extract import DataExtractor
+    from src.etl.pipeline import ETLPipeline
+
     logger.info("=== Loading Asset Metadata ===")
-    config = load_config()
-    metadata_storage = ParquetStorage(config.settings.metadata_dir)
+    config = _load_config()
+    metadata_storage = _storage(config.settings.metadata_dir)
     extractor = DataExtractor()
 
     full_load = getattr(args, "full", False)
@@ -39,22 +82,30 @@ def cmd_load_metadata(args: argparse.Namespace) -> None:
 
     # Run metadata updates for ALL tickers (universe + portfolios)
     try:
-        existing_metadata = metadata_storage.read("asset_metadata")
-        known_tickers = existing_metadata.select("ticker").to_series().to_list()
+        existing_metadata = metadata_storage.read("asset_metadata", columns=ETL_METADATA_COLUMNS)
+        known_tickers = set(existing_metadata.get_column("ticker").to_list())
     except FileNotFoundError:
-        existing_metadata = pl.DataFrame()
-        known_tickers = []
-    new_tickers = [t for t in total_tickers if t not in set(known_tickers)]
+        existing_metadata = None
+        known_tickers = set()
+    new_tickers = [t for t in total_tickers if t not in known_tickers]
     logger.info(f"Loading ticker metadata for {len(new_tickers)} tickers")
     metadata_pipeline = ETLPipeline(metadata_storage, extractor)
     metadata_pipeline.run_metadata_update(new_tickers)
 
+    # Only re-read when the update could have changed the file
+    if existing_metadata is not None and not new_tickers:
+        return existing_metadata
+    return metadata_storage.read("asset_metadata", columns=ETL_METADATA_COLUMNS)
+
 
 def cmd_update_metadata(args: argparse.Namespace) -> None:
     """Update existing metadata with new tickers."""
+    from src.etl.extract import DataExtractor
+    from src.etl.pipeline import ETLPipeline
+
     logger.info("=== Updating Asset Metadata ===")
-    config = load_config()
-    metadata_storage = ParquetStorage(config.settings.metadata_dir)
+    config = _load_config()
+    metadata_storage = _storage(config.settings.metadata_dir)
     extractor = DataExtractor()
 
     if getattr(args, "full", False):
@@ -67,13 +118,20 @@ def cmd_update_metadata(args: argparse.Namespace) -> None:
     metadata_pipeline.run_metadata_update(total_tickers)
 
 
-def load_fundamentals(config: Config, full_load: bool = False) -> None:
-    fundamentals_storage = ParquetStorage(
-        config.settings.fundamentals_dir, subdirectories=["annual", "quarterly"]
-    )
-    metadata_storage = ParquetStorage(config.settings.metadata_dir)
+def load_fundamentals(
+    config: Config, full_load: bool = False, metadata: pl.DataFrame | None = None
+) -> None:
+    import polars as pl
 
-    metadata = metadata_storage.read("asset_metadata")
+    from src.core.domain_models import AssetType
+    from src.etl.extract import DataExtractor
+    from src.etl.pipeline import ETLPipeline
+
+    fundamentals_storage = _storage(config.settings.fundamentals_dir, "annual", "quarterly")
+    if metadata is None:
+        metadata = _storage(config.settings.metadata_dir).read(
+            "asset_metadata", columns=ETL_METADATA_COLUMNS
+        )
 
     # Initialize extractor
     extractor = DataExtractor()
@@ -85,17 +143,15 @@ def load_fundamentals(config: Config, full_load: bool = False) -> None:
     )
 
     # check if all tickers have metadata
-    missing_tickers = set(total_tickers) - set(
-        tickers_metadata.select("ticker").to_series().to_list()
-    )
+    have_metadata = set(tickers_metadata.get_column("ticker").to_list())
+    missing_tickers = [t for t in total_tickers if t not in have_metadata]
     if missing_tickers:
         logger.warning(f"Metadata missing for {len(missing_tickers)} tickers: {missing_tickers}")
 
     logger.info(f"Updating prices for {len(tickers_metadata)} tickers (universe + portfolios)")
     stock_tickers = (
         tickers_metadata.filter(pl.col("asset_type") == AssetType.STOCK)
-        .select("ticker")
-        .to_series()
+        .get_column("ticker")
         .to_list()
     )
     logger.info(f"Updating fundamentals for {len(stock_tickers)} stocks")
@@ -106,30 +162,32 @@ def load_fundamentals(config: Config, full_load: bool = False) -> None:
 def cmd_etl_fundamentals(args: argparse.Namespace) -> None:
     """Run ETL pipeline for fundamentals only."""
     logger.info("=== Running Fundamentals ETL Pipeline ===")
-    cmd_load_metadata(args)
+    metadata = cmd_load_metadata(args)
 
     # Load configuration
-    config = load_config()
+    config = _load_config()
     full_load = getattr(args, "full", False)
-    load_fundamentals(config, full_load=full_load)
+    load_fundamentals(config, full_load=full_load, metadata=metadata)
 
     logger.success("✅ ETL Pipeline for fundamentals completed successfully")
 
 
 def cmd_etl(args: argparse.Namespace) -> None:
     """Run ETL pipeline for prices and fundamentals."""
+    import polars as pl
+
+    from src.etl.extract import DataExtractor
+    from src.etl.pipeline import ETLPipeline
+
     logger.info("=== Running ETL Pipeline ===")
 
-    cmd_load_metadata(args)
+    metadata = cmd_load_metadata(args)
 
     # Load configuration
-    config = load_config()
+    config = _load_config()
 
     # Initialize storage
-    prices_storage = ParquetStorage(config.settings.prices_dir)
-    metadata_storage = ParquetStorage(config.settings.metadata_dir)
-
-    metadata = metadata_storage.read("asset_metadata")
+    prices_storage = _storage(config.settings.prices_dir)
 
     # Initialize extractor
     extractor = DataExtractor()
@@ -146,30 +204,56 @@ def cmd_etl(args: argparse.Namespace) -> None:
         .drop_nulls()
     )
 
-    # check if all tickers have metadata
-    missing_tickers = set(total_tickers) - set(
-        tickers_metadata.select("ticker").to_series().to_list()
-    )
+    # check if all tickers have metadata; the ticker list is materialized once
+    # and serves both this check and the price update
+    tickers = tickers_metadata.get_column("ticker").to_list()
+    have_metadata = set(tickers)
+    missing_tickers = [t for t in total_tickers if t not in have_metadata]
     if missing_tickers:
         logger.warning(f"Metadata missing for {len(missing_tickers)} tickers: {missing_tickers}")
 
-    logger.info(f"Updating prices for {len(tickers_metadata)} tickers (universe + portfolios)")
+    logger.info(f"Updating prices for {len(tickers)} tickers (universe + portfolios)")
     price_pipeline = ETLPipeline(prices_storage, extractor)
-    price_pipeline.run_price_update(
-        tickers_metadata.select("ticker").to_series().to_list(), metadata
-    )
 
-    load_fundamentals(config, full_load=full_load)
+    # Prices and fundamentals hit different endpoints and write to different
+    # storages, so both network-bound pipelines run side by side; the
+    # fundamentals use their own extractor
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(price_pipeline.run_price_update, tickers, metadata),
+            pool.submit(load_fundamentals, config, full_load=full_load, metadata=metadata),
+        ]
+        for future in as_completed(futures):
+            future.result()
+
     logger.success("✅ ETL Pipeline completed successfully")
     # In the future we might run also extra actions for e.g. ETF here
 
 
 def cmd_snapshot(args: argparse.Namespace) -> None:
     """Create compressed snapshots of price and fundamental data."""
+    from src.etl.snapshot import make_snapshot
+
     try:
-        make_snapshot(args.data_type)
+        failed = make_snapshot(args.data_type)
     except Exception:
         sys.exit(1)
+    if failed:
+        sys.exit(1)
+
+
+def _restore_latest(archiver: DataArchiver, data_type: str, target_base: Path) -> None:
+    """Restore the newest snapshot of one data type into target_base/<data_type>."""
+    snapshots = archiver.list_snapshots(data_type, limit=1)
+    if not snapshots:
+        logger.warning(f"No {data_type} snapshots found, skipping {data_type} restore")
+        return
+
+    latest = snapshots[0]
+    target_dir = target_base / data_type
+    logger.info(f"Restoring {data_type} from {latest.name}")
+    archiver.restore_snapshot(latest, target_dir)
+    logger.success(f"✅ {data_type.capitalize()} restored to {target_dir}")
 
 
 def cmd_restore(args: argparse.Namespace) -> None:
@@ -177,10 +261,10 @@ def cmd_restore(args: argparse.Namespace) -> None:
     logger.info("=== Restoring Data from Snapshot ===")
 
     # Load configuration
-    config = load_config()
+    config = _load_config()
 
     # Initialize archiver
-    archiver = DataArchiver(config.settings.base_dir, config.settings.archive_dir)
+    archiver = _archiver()
 
     # High-level mode: Restore latest snapshots for prices, fundamentals, and metadata
     if args.snapshot_file is None:
@@ -190,50 +274,23 @@ def cmd_restore(args: argparse.Namespace) -> None:
 
         target_base = Path(args.target_dir) if args.target_dir else config.settings.base_dir
 
-        # Restore prices
-        price_snapshots = archiver.list_snapshots("prices")
-        if not price_snapshots:
-            logger.warning("No prices snapshots found, skipping prices restore")
-        else:
-            latest_prices = price_snapshots[0]
-            target_prices = target_base / "prices"
-            logger.info(f"Restoring prices from {latest_prices.name}")
-            try:
-                archiver.restore_snapshot(latest_prices, target_prices)
-                logger.success(f"✅ Prices restored to {target_prices}")
-            except Exception as e:
-                logger.error(f"Failed to restore prices: {e}")
-                sys.exit(1)
-
-        # Restore fundamentals
-        fund_snapshots = archiver.list_snapshots("fundamentals")
-        if not fund_snapshots:
-            logger.warning("No fundamentals snapshots found, skipping fundamentals restore")
-        else:
-            latest_fund = fund_snapshots[0]
-            target_fund = target_base / "fundamentals"
-            logger.info(f"Restoring fundamentals from {latest_fund.name}")
-            try:
-                archiver.restore_snapshot(latest_fund, target_fund)
-                logger.success(f"✅ Fundamentals restored to {target_fund}")
-            except Exception as e:
-                logger.error(f"Failed to restore fundamentals: {e}")
-                sys.exit(1)
-
-        # Restore metadata
-        metadata_snapshots = archiver.list_snapshots("metadata")
-        if not metadata_snapshots:
-            logger.warning("No metadata snapshots found, skipping metadata restore")
-        else:
-            latest_metadata = metadata_snapshots[0]
-            target_metadata = target_base / "metadata"
-            logger.info(f"Restoring metadata from {latest_metadata.name}")
-            try:
-                archiver.restore_snapshot(latest_metadata, target_metadata)
-                logger.success(f"✅ Metadata restored to {target_metadata}")
-            except Exception as e:
-                logger.error(f"Failed to restore metadata: {e}")
-                sys.exit(1)
+        # The data types restore into disjoint directories, so they can run
+        # concurrently; a failure is reported only after the others finished
+        failed = []
+        with ThreadPoolExecutor(max_workers=len(RESTORE_DATA_TYPES)) as pool:
+            futures = {
+                pool.submit(_restore_latest, archiver, data_type, target_base): data_type
+                for data_type in RESTORE_DATA_TYPES
+            }
+            for future in as_completed(futures):
+                data_type = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Failed to restore {data_type}: {e}")
+                    failed.append(data_type)
+        if failed:
+            sys.exit(1)
 
         logger.success(f"✅ All snapshots restored to {target_base}")
         return
@@ -244,16 +301,19 @@ def cmd_restore(args: argparse.Namespace) -> None:
     if args.target_dir:
         target_dir = Path(args.target_dir)
     else:
-        # Auto-detect from snapshot name
-        if "prices" in snapshot_path.name:
-            target_dir = config.settings.prices_dir
-        elif "fundamentals" in snapshot_path.name:
-            target_dir = config.settings.fundamentals_dir
-        elif "metadata" in snapshot_path.name:
-            target_dir = config.settings.metadata_dir
-        else:
+        # Auto-detect from the data type prefix of the snapshot name
+        # ("<data_type>_snapshot_<date>.parquet"); only the file name counts,
+        # so a directory like "fundamentals_backup/" cannot change the match
+        target_dirs = {
+            "prices": config.settings.prices_dir,
+            "fundamentals": config.settings.fundamentals_dir,
+            "metadata": config.settings.metadata_dir,
+        }
+        detected = target_dirs.get(snapshot_path.stem.split("_", 1)[0])
+        if detected is None:
             logger.error("Cannot auto-detect target directory. Use --target-dir")
             sys.exit(1)
+        target_dir = detected
 
     try:
         archiver.restore_snapshot(snapshot_path, target_dir)
@@ -265,19 +325,17 @@ def cmd_restore(args: argparse.Namespace) -> None:
 
 def cmd_list_snapshots(args: argparse.Namespace) -> None:
     """List available snapshots."""
-    config = load_config()
-    archiver = DataArchiver(config.settings.base_dir, config.settings.archive_dir)
+    archiver = _archiver()
 
-    snapshots = archiver.list_snapshots(args.data_type)
+    snapshots = archiver.list_snapshot_sizes(args.data_type)
 
     if not snapshots:
         logger.info("No snapshots found")
         return
 
     logger.info(f"Found {len(snapshots)} snapshot(s):")
-    for snapshot in snapshots:
-        size_mb = snapshot.stat().st_size / 1024 / 1024
-        logger.info(f"  • {snapshot.name} ({size_mb:.2f} MB)")
+    for name, size in snapshots:
+        logger.info(f"  • {name} ({size / 1_048_576:.2f} MB)")
 
 
 def main() -> None:
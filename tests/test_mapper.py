@@ -0,0 +1,33 @@
+"""Regression tests for the fundamentals mapper."""
+
+import pandas as pd
+
+from src.core.domain_models import ReportType
+from src.core.mapper import map_fundamentals_to_domain
+
+
+def test_fundamentals_with_comma_strings_and_mixed_dtypes() -> None:
+    """Thousands-separated strings parse like in _get_float, next to float metrics."""
+    dates = pd.to_datetime(["2024-12-31", "2023-12-31"])
+    # Mixed: an object column with comma strings next to plain floats
+    mixed = pd.DataFrame(
+        {dates[0]: ["1,000", 5.0, 7.0], dates[1]: ["500", 6.0, None]},
+        index=["Total Revenue", "Net Income", "Total Assets"],
+        dtype=object,
+    )
+    reports = map_fundamentals_to_domain(mixed, "TEST", ReportType.ANNUAL, "USD")
+
+    assert [report.revenue for report in reports] == [1000.0, 500.0]
+    assert [report.net_income for report in reports] == [5.0, 6.0]
+    assert [report.total_assets for report in reports] == [7.0, None]
+
+    # All-object statement, unparseable entries become missing values
+    strings = pd.DataFrame(
+        {dates[0]: ["1,000", "2"], dates[1]: ["n/a", None]},
+        index=["Total Revenue", "EBIT"],
+    )
+    reports = map_fundamentals_to_domain(strings, "TEST", ReportType.ANNUAL, "USD")
+
+    assert len(reports) == 1
+    assert reports[0].revenue == 1000.0
+    assert reports[0].ebit == 2.0